@@ -5,6 +5,13 @@ __author__ = "hcharbonnier"
 __email__ = "hugues.charbonnier@gmail.com"
 __description__ = "Python CLI tool for optimizing embedded video subtitles"
 
-from .errors import SubTunerError
+__all__ = ["SubTunerError"]
 
-__all__ = ["SubTunerError"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    """Import public names lazily on first access (PEP 562)"""
+    if name == "SubTunerError":
+        from .errors import SubTunerError
+        globals()[name] = SubTunerError  # Later lookups skip __getattr__
+        return SubTunerError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,21 +1,77 @@
 """Command-line interface for SubTuner"""
 
+import heapq
 import logging
 import os
+import stat
 import sys
-from pathlib import Path
-from typing import List, Optional
+from contextlib import nullcontext
+from dataclasses import replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
 
 import click
 
+from . import __version__
 from .config import GlobalConfig, OptimizationConfig, ProcessingConfig
-from .errors import SubTunerError
-from .extraction.extractor import SubtitleExtractor
-from .optimization.engine import OptimizationEngine
-from .parsers.base import get_parser_for_file
-from .statistics.reporter import StatisticsReporter, ReportFormat
-from .video.analyzer import VideoAnalyzer
-from .writers.base import get_writer_for_format
+from .errors import SubtitleExtractionError, SubTunerError
+
+# Processing components (and the parsing libraries behind them), as well as
+# tempfile and concurrent.futures, are imported on first use so that --help,
+# --version and subtitle-only runs start fast
+if TYPE_CHECKING:
+    import tempfile
+    from concurrent.futures import Future
+    
+    from .extraction.extractor import SubtitleExtractor
+    from .optimization.engine import OptimizationEngine
+    from .statistics.reporter import StatisticsReporter, ReportFormat
+    from .video.analyzer import VideoAnalyzer
+
+
+# Supported file extensions (lower-case)
+_VIDEO_EXTS = frozenset({'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'})
+_SUBTITLE_EXTS = frozenset({'.srt', '.ass', '.ssa', '.vtt'})
+_ALL_EXTS = _VIDEO_EXTS | _SUBTITLE_EXTS
+
+# Same extensions as a tuple for str.endswith() filtering
+_ALL_EXTS_TUPLE = tuple(sorted(_ALL_EXTS))
+
+# File kind by lower-cased extension
+_EXT_KIND = {
+    **dict.fromkeys(_VIDEO_EXTS, 'video'),
+    **dict.fromkeys(_SUBTITLE_EXTS, 'subtitle'),
+}
+
+# Number of files listed before asking to confirm a batch
+_PREVIEW_LIMIT = 10
+
+# Upper bound for --jobs 0; beyond this FFmpeg runs contend for disk I/O
+_MAX_AUTO_JOBS = 8
+
+# Exit code, message and whether to log the traceback for errors escaping
+# main(), checked in order so the first matching type wins
+_EXIT_HANDLERS: Dict[type, Tuple[int, str, bool]] = {
+    SubTunerError: (1, "❌ SubTuner error: {e}", False),
+    KeyboardInterrupt: (130, "⚠️  Processing interrupted by user", False),
+    Exception: (1, "💥 Unexpected error: {e}", True),
+}
+
+
+class ReportFormatType(click.Choice):
+    """Click parameter type converting --report-format to a ReportFormat"""
+    
+    name = 'report_format'
+    
+    def __init__(self):
+        super().__init__(['console', 'json', 'markdown', 'csv'])
+    
+    def convert(self, value, param, ctx) -> "ReportFormat":
+        from .statistics.reporter import ReportFormat
+        
+        if isinstance(value, ReportFormat):
+            return value
+        return ReportFormat(super().convert(value, param, ctx))
 
 
 # Configure logging
@@ -109,6 +165,12 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     is_flag=True,
     help='Preview changes without writing files'
 )
+@click.option(
+    '--jobs',
+    default=1,
+    type=click.IntRange(min=0),
+    help='Number of videos to process in parallel in batch mode (0 = one per CPU up to 8, default: 1)'
+)
 @click.option(
     '--verbose', 
     is_flag=True,
@@ -121,7 +183,7 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
 )
 @click.option(
     '--report-format',
-    type=click.Choice(['console', 'json', 'markdown', 'csv']),
+    type=ReportFormatType(),
     default='console',
     help='Report output format'
 )
@@ -142,7 +204,7 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     default=0,
     help='Adjust Y position for dialog subtitles in ASS format (e.g., +100 or -100 pixels)'
 )
-@click.version_option(version="0.1.0", prog_name="SubTuner")
+@click.version_option(version=__version__, prog_name="SubTuner")
 def main(
     input_paths: tuple,
     chars_per_sec: float,
@@ -157,9 +219,10 @@ def main(
     output_label: str,
     force: bool,
     dry_run: bool,
+    jobs: int,
     verbose: bool,
     quiet: bool,
-    report_format: str,
+    report_format: "ReportFormat",
     save_report: Optional[str],
     ass_font_size_adjust: int,
     ass_y_position_adjust: int
@@ -193,6 +256,9 @@ def main(
         
         # Save detailed report
         subtuner movie.mkv --save-report report.json --report-format json
+        
+        # Process a batch with one worker per CPU core (up to 8)
+        subtuner series/*.mkv --jobs 0
     """
     try:
         # Set up logging
@@ -217,52 +283,47 @@ def main(
             output_label=output_label,
             force=force,
             dry_run=dry_run,
+            jobs=jobs,
             verbose=verbose,
             quiet=quiet,
             ass_font_size_adjust=ass_font_size_adjust,
             ass_y_position_adjust=ass_y_position_adjust
         )
         
-        # Initialize CLI processor
-        cli = SubTunerCLI(config)
+        # Initialize CLI processor; closing it removes its temporary files
+        with SubTunerCLI(config) as cli:
+            # Convert tuple to list and expand directories
+            input_list = cli.expand_video_paths(list(input_paths))
         
-        # Convert tuple to list and expand directories
-        input_list = cli.expand_video_paths(list(input_paths))
+            if not input_list:
+                if not quiet:
+                    click.echo("❌ No video or subtitle files found to process")
+                sys.exit(1)
         
-        if not input_list:
-            if not quiet:
-                click.echo("❌ No video or subtitle files found to process")
-            sys.exit(1)
-        
-        # Process files
-        if len(input_list) == 1:
-            # Single file processing
-            results = cli.process_single_video(input_list[0])
-        else:
-            # Batch processing
-            results = cli.process_batch_videos(input_list)
+            # Process files
+            if len(input_list) == 1:
+                # Single file processing
+                results = cli.process_file(input_list[0])
+            else:
+                # Batch processing
+                results = cli.process_batch_videos(input_list)
         
-        # Generate and display reports
-        report_fmt = ReportFormat(report_format)
-        cli.generate_reports(results, report_fmt, save_report)
+            # Generate and display reports
+            cli.generate_reports(results, report_format, save_report)
         
         if not quiet:
             click.echo("\n✅ SubTuner processing complete!")
         
-    except SubTunerError as e:
-        if not quiet:
-            click.echo(f"\n❌ SubTuner error: {e}", err=True)
-        sys.exit(1)
-    except KeyboardInterrupt:
-        if not quiet:
-            click.echo("\n⚠️  Processing interrupted by user", err=True)
-        sys.exit(130)
-    except Exception as e:
-        logger = logging.getLogger(__name__)
-        logger.exception("Unexpected error occurred")
+    except tuple(_EXIT_HANDLERS) as e:
+        exit_code, message, log_traceback = next(
+            handler for error_type, handler in _EXIT_HANDLERS.items()
+            if isinstance(e, error_type)
+        )
+        if log_traceback:
+            logging.getLogger(__name__).exception("Unexpected error occurred")
         if not quiet:
-            click.echo(f"\n💥 Unexpected error: {e}", err=True)
-        sys.exit(1)
+            click.echo("\n" + message.format(e=e), err=True)
+        sys.exit(exit_code)
 
 
 class SubTunerCLI:
@@ -277,37 +338,79 @@ class SubTunerCLI:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        # Initialize components
-        self.video_analyzer = VideoAnalyzer()
-        self.extractor = SubtitleExtractor(temp_dir=config.processing.temp_dir)
-        self.optimizer = OptimizationEngine()
-        self.reporter = StatisticsReporter()
-        
         self.logger.debug("SubTuner CLI initialized")
     
-    def _is_subtitle_file(self, path: str) -> bool:
-        """Check if a file is a subtitle file
+    def __enter__(self) -> "SubTunerCLI":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Remove the temporary directory holding extracted subtitle tracks"""
+        work_dir = self.__dict__.pop('_work_dir', None)
+        if work_dir is not None:
+            work_dir.cleanup()
+    
+    # Components are created on first use
+    
+    def warmup(self) -> None:
+        """Load processing components ahead of the first file
         
-        Args:
-            path: File path to check
-            
-        Returns:
-            True if file is a subtitle file
+        Batch workers call this once at startup so that imports and
+        component setup are not charged to the first file they process.
+        The FFmpeg-backed components are left lazy since they fail when
+        FFmpeg is missing, which subtitle-only batches do not need.
         """
-        subtitle_extensions = {'.srt', '.ass', '.ssa', '.vtt'}
-        return Path(path).suffix.lower() in subtitle_extensions
+        from .parsers.base import get_parser_for_file  # noqa: F401
+        from .writers.base import get_writer_for_format  # noqa: F401
+        
+        self.optimizer
+    
+    @cached_property
+    def video_analyzer(self) -> "VideoAnalyzer":
+        """Video analyzer used to list subtitle tracks"""
+        from .video.analyzer import VideoAnalyzer
+        return VideoAnalyzer()
     
-    def _is_video_file(self, path: str) -> bool:
-        """Check if a file is a video file
+    @cached_property
+    def _work_dir(self) -> "tempfile.TemporaryDirectory":
+        """Temporary directory for the extracted tracks of this run"""
+        import tempfile
+        return tempfile.TemporaryDirectory(prefix="subtuner_", dir=self.config.processing.temp_dir)
+    
+    @cached_property
+    def extractor(self) -> "SubtitleExtractor":
+        """Extractor used to pull subtitle tracks out of videos
+        
+        Extracted tracks are written to the run's temporary directory and
+        removed together with it by close().
+        """
+        from .extraction.extractor import SubtitleExtractor
+        return SubtitleExtractor(temp_dir=self._work_dir.name)
+    
+    @cached_property
+    def optimizer(self) -> "OptimizationEngine":
+        """Optimization engine applied to every subtitle track"""
+        from .optimization.engine import OptimizationEngine
+        return OptimizationEngine()
+    
+    @cached_property
+    def reporter(self) -> "StatisticsReporter":
+        """Reporter collecting session statistics"""
+        from .statistics.reporter import StatisticsReporter
+        return StatisticsReporter()
+    
+    def _classify(self, path: str) -> Optional[str]:
+        """Classify a file by its extension
         
         Args:
             path: File path to check
             
         Returns:
-            True if file is a video file
+            'video', 'subtitle', or None if the file type is unsupported
         """
-        video_extensions = {'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        return Path(path).suffix.lower() in video_extensions
+        return _EXT_KIND.get(os.path.splitext(path)[1].lower())
     
     def expand_video_paths(self, paths: List[str]) -> List[str]:
         """Expand directory paths to video and subtitle files with confirmation
@@ -318,62 +421,64 @@ class SubTunerCLI:
         Returns:
             Expanded list of video and subtitle file paths
         """
-        video_extensions = {'.mkv', '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        subtitle_extensions = {'.srt', '.ass', '.ssa', '.vtt'}
-        all_extensions = video_extensions | subtitle_extensions
+        quiet = self.config.processing.quiet
+        
+        # Fast path for the common single-file invocation
+        if len(paths) == 1 and self._classify(paths[0]) is not None and os.path.isfile(paths[0]):
+            return [paths[0]]
+        
         expanded = []
         explicitly_provided_files = []
         
         for path in paths:
-            path_obj = Path(path)
+            # Click already rejected missing paths; one stat per input tells
+            # files and directories apart (and catches paths removed since)
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                self.logger.warning("Path not found: %s", path)
+                continue
             
-            if path_obj.is_file():
+            if stat.S_ISREG(mode):
                 # Add file directly if it's a video or subtitle
-                if self._is_video_file(str(path_obj)) or self._is_subtitle_file(str(path_obj)):
-                    explicitly_provided_files.append(str(path_obj))
+                if self._classify(path) is not None:
+                    explicitly_provided_files.append(path)
                 else:
-                    self.logger.warning(f"Unsupported file type: {path}")
+                    self.logger.warning("Unsupported file type: %s", path)
                 
-            elif path_obj.is_dir():
-                # Find all video and subtitle files in directory
-                found_files = []
-                for ext in all_extensions:
-                    found_files.extend(path_obj.glob(f'*{ext}'))
-                    found_files.extend(path_obj.glob(f'*{ext.upper()}'))
+            elif stat.S_ISDIR(mode):
+                if quiet:
+                    # In quiet mode, process without confirmation
+                    expanded.extend(self._list_media_dir(path))
+                    continue
                 
-                if found_files:
-                    # Sort files for consistent ordering
-                    found_files = sorted(set(str(f) for f in found_files))
+                # Count and preview with a streaming pass; the full listing
+                # is only built once the user confirms
+                total, preview = self._preview_media_dir(path, _PREVIEW_LIMIT)
+                
+                if total:
+                    click.echo(self._format_file_preview(
+                        f"\n📁 Found {total} file(s) in {path}:", preview, total
+                    ))
                     
-                    if not self.config.processing.quiet:
-                        click.echo(f"\n📁 Found {len(found_files)} file(s) in {path}:")
-                        for i, vf in enumerate(found_files[:10], 1):  # Show first 10
-                            click.echo(f"  {i}. {Path(vf).name}")
-                        if len(found_files) > 10:
-                            click.echo(f"  ... and {len(found_files) - 10} more")
-                        
-                        # Ask for confirmation
-                        if click.confirm(f"\n⚠️  Process all {len(found_files)} file(s)?", default=True):
-                            expanded.extend(found_files)
-                        else:
-                            click.echo("Skipping directory")
+                    # Ask for confirmation
+                    if click.confirm(f"\n⚠️  Process all {total} file(s)?", default=True):
+                        expanded.extend(self._list_media_dir(path))
                     else:
-                        # In quiet mode, process without confirmation
-                        expanded.extend(found_files)
+                        click.echo("Skipping directory")
                 else:
-                    if not self.config.processing.quiet:
-                        click.echo(f"⚠️  No video or subtitle files found in {path}")
+                    click.echo(f"⚠️  No video or subtitle files found in {path}")
             else:
-                self.logger.warning(f"Path not found: {path}")
+                self.logger.warning("Unsupported file type: %s", path)
         
         # Handle multiple explicitly provided files with confirmation
         if len(explicitly_provided_files) > 1:
-            if not self.config.processing.quiet:
-                click.echo(f"\n📄 Found {len(explicitly_provided_files)} file(s) specified:")
-                for i, file_path in enumerate(explicitly_provided_files[:10], 1):  # Show first 10
-                    click.echo(f"  {i}. {Path(file_path).name}")
-                if len(explicitly_provided_files) > 10:
-                    click.echo(f"  ... and {len(explicitly_provided_files) - 10} more")
+            if not quiet:
+                click.echo(self._format_file_preview(
+                    f"\n📄 Found {len(explicitly_provided_files)} file(s) specified:",
+                    [os.path.basename(p) for p in explicitly_provided_files[:_PREVIEW_LIMIT]],
+                    len(explicitly_provided_files)
+                ))
                 
                 # Ask for confirmation
                 if click.confirm(f"\n⚠️  Process all {len(explicitly_provided_files)} file(s)?", default=True):
@@ -389,6 +494,86 @@ class SubTunerCLI:
         
         return expanded
     
+    @staticmethod
+    def _scan_media_dir(path: str) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield the video and subtitle files of a directory
+        
+        Uses a single listing pass; extension match is case-insensitive.
+        Each name is lower-cased once and handed out as the sort key.
+        
+        Args:
+            path: Directory path
+            
+        Yields:
+            (lower-cased name, directory entry) pairs of supported files,
+            in listing order
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                lower_name = entry.name.lower()
+                if lower_name.endswith(_ALL_EXTS_TUPLE) and entry.is_file():
+                    yield lower_name, entry
+    
+    def _list_media_dir(self, path: str) -> List[str]:
+        """List the video and subtitle files of a directory by name
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            List of file paths, sorted case-insensitively by name
+        """
+        # Decorate with the precomputed lower-cased name; the exact name
+        # breaks ties so the order stays deterministic
+        found = [
+            (lower_name, entry.name, entry.path)
+            for lower_name, entry in self._scan_media_dir(path)
+        ]
+        found.sort()
+        return [file_path for _, _, file_path in found]
+    
+    def _preview_media_dir(self, path: str, limit: int) -> Tuple[int, List[str]]:
+        """Count a directory's supported files and get the first names
+        
+        Only the preview names are kept in memory.
+        
+        Args:
+            path: Directory path
+            limit: Number of names to return
+            
+        Returns:
+            Tuple of (total file count, first file names in sort order)
+        """
+        total = 0
+        
+        def names() -> Iterator[Tuple[str, str]]:
+            nonlocal total
+            for lower_name, entry in self._scan_media_dir(path):
+                total += 1
+                yield lower_name, entry.name
+        
+        # Same ordering as _list_media_dir
+        preview = [name for _, name in heapq.nsmallest(limit, names())]
+        return total, preview
+    
+    @staticmethod
+    def _format_file_preview(header: str, names: List[str], total: int) -> str:
+        """Build a file listing preview as one block of text
+        
+        Args:
+            header: First line of the preview
+            names: File names to list
+            total: Total number of files, including those not listed
+            
+        Returns:
+            Preview text, written with a single echo
+        """
+        lines = [header]
+        lines.extend(f"  {i}. {name}" for i, name in enumerate(names, 1))
+        if total > len(names):
+            lines.append(f"  ... and {total - len(names)} more")
+        return "\n".join(lines)
+    
     def process_subtitle_file(self, subtitle_path: str) -> dict:
         """Process a single subtitle file directly
         
@@ -398,10 +583,15 @@ class SubTunerCLI:
         Returns:
             Dictionary with processing results
         """
-        self.logger.info(f"Processing subtitle file: {Path(subtitle_path).name}")
+        processing = self.config.processing
+        quiet = processing.quiet
+        self.logger.info("Processing subtitle file: %s", os.path.basename(subtitle_path))
+        
+        if not quiet:
+            click.echo(f"\n📝 Processing subtitle: {os.path.basename(subtitle_path)}")
         
-        if not self.config.processing.quiet:
-            click.echo(f"\n📝 Processing subtitle: {Path(subtitle_path).name}")
+        from .parsers.base import get_parser_for_file
+        from .writers.base import get_writer_for_format
         
         try:
             # Parse subtitles
@@ -416,7 +606,7 @@ class SubTunerCLI:
             subtitles = parser.parse(subtitle_path)
             
             if not subtitles:
-                if not self.config.processing.quiet:
+                if not quiet:
                     click.echo("⚠️  No subtitles found in file")
                 return {
                     'file_path': subtitle_path,
@@ -425,7 +615,7 @@ class SubTunerCLI:
                     'optimized_count': 0
                 }
             
-            if not self.config.processing.quiet:
+            if not quiet:
                 click.echo(f"📊 Found {len(subtitles)} subtitle entries")
             
             # Optimize subtitles
@@ -437,9 +627,10 @@ class SubTunerCLI:
             
             # Write optimized subtitles (unless dry run)
             output_path = None
-            if not self.config.processing.dry_run:
+            if not processing.dry_run:
                 # Determine format from file extension
-                file_ext = Path(subtitle_path).suffix.lower()
+                base, file_ext = os.path.splitext(subtitle_path)
+                file_ext = file_ext.lower()
                 format_name = file_ext[1:]  # Remove the dot
                 
                 writer = get_writer_for_format(format_name)
@@ -453,31 +644,21 @@ class SubTunerCLI:
                 # Apply ASS-specific adjustments if this is an ASS file
                 if format_name in ['ass', 'ssa'] and hasattr(writer, 'set_adjustments'):
                     writer.set_adjustments(
-                        font_size_adjust=self.config.processing.ass_font_size_adjust,
-                        y_position_adjust=self.config.processing.ass_y_position_adjust
+                        font_size_adjust=processing.ass_font_size_adjust,
+                        y_position_adjust=processing.ass_y_position_adjust
                     )
                 
-                # Generate output path
-                subtitle_path_obj = Path(subtitle_path)
-                if self.config.processing.output_dir:
-                    output_dir = Path(self.config.processing.output_dir)
-                else:
-                    output_dir = subtitle_path_obj.parent
-                
-                # Build output filename with label
-                base_name = subtitle_path_obj.stem
-                parts = [base_name]
-                
-                if self.config.processing.output_label:
-                    parts.append(self.config.processing.output_label)
-                
-                output_filename = ".".join(parts) + file_ext
-                output_path = str(output_dir / output_filename)
+                # Generate output path, with label when configured
+                input_dir, stem = os.path.split(base)
+                output_dir = processing.output_dir or input_dir
+                label = processing.output_label
+                output_filename = f"{stem}.{label}{file_ext}" if label else f"{stem}{file_ext}"
+                output_path = os.path.join(output_dir, output_filename)
                 
                 # Check if file exists and force is not set
-                if os.path.exists(output_path) and not self.config.processing.force:
-                    if not self.config.processing.quiet:
-                        click.echo(f"⏭️  Skipped: {Path(output_path).name} (already exists, use --force to overwrite)")
+                if os.path.exists(output_path) and not processing.force:
+                    if not quiet:
+                        click.echo(f"⏭️  Skipped: {os.path.basename(output_path)} (already exists, use --force to overwrite)")
                     return {
                         'file_path': subtitle_path,
                         'status': 'skipped',
@@ -488,8 +669,8 @@ class SubTunerCLI:
                 
                 writer.write_safely(optimization_result.subtitles, output_path)
                 
-                if not self.config.processing.quiet:
-                    click.echo(f"💾 Saved: {Path(output_path).name}")
+                if not quiet:
+                    click.echo(f"💾 Saved: {os.path.basename(output_path)}")
             
             return {
                 'file_path': subtitle_path,
@@ -501,63 +682,78 @@ class SubTunerCLI:
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to process {subtitle_path}: {e}")
+            self.logger.error("Failed to process %s: %s", subtitle_path, e)
             return {
                 'file_path': subtitle_path,
                 'status': 'error',
                 'error': str(e)
             }
     
-    def process_single_video(self, video_path: str) -> dict:
-        """Process a single video or subtitle file
+    def process_file(self, file_path: str, prefetched: Optional["Future"] = None) -> dict:
+        """Process a video or subtitle file with the matching processor
         
         Args:
-            video_path: Path to video or subtitle file
+            file_path: Path to video or subtitle file
+            prefetched: Pending _extract_video_tracks result for a video
             
         Returns:
-            Dictionary with processing results
+            Subtitle file results (with 'file_path') or video results
+            (with 'video_path' and 'tracks')
         """
-        # Check if this is a subtitle file
-        if self._is_subtitle_file(video_path):
-            result = self.process_subtitle_file(video_path)
-            # Wrap result in video-like structure for compatibility
-            return {
-                'video_path': video_path,
-                'tracks': [result] if result.get('status') == 'success' else [],
-                'status': result.get('status', 'error'),
-                'error': result.get('error') if 'error' in result else None
-            }
+        if self._classify(file_path) == 'subtitle':
+            return self.process_subtitle_file(file_path)
+        return self.process_single_video(file_path, prefetched)
+    
+    def process_single_video(
+        self,
+        video_path: str,
+        prefetched: Optional["Future"] = None
+    ) -> dict:
+        """Process a single video file
         
-        # Original video processing logic
-        self.logger.info(f"Processing video file: {Path(video_path).name}")
+        Args:
+            video_path: Path to video file
+            prefetched: Pending _extract_video_tracks result for this video,
+                started ahead of time by the batch loop
+            
+        Returns:
+            Dictionary with processing results
+        """
+        quiet = self.config.processing.quiet
+        self.logger.info("Processing video file: %s", os.path.basename(video_path))
         
-        if not self.config.processing.quiet:
-            click.echo(f"\n📹 Processing video: {Path(video_path).name}")
+        if not quiet:
+            click.echo(f"\n📹 Processing video: {os.path.basename(video_path)}")
         
         try:
             # Analyze video for subtitle tracks
-            if not self.config.processing.quiet:
+            if not quiet:
                 click.echo("🔍 Analyzing video for subtitle tracks...")
             
-            tracks = self.video_analyzer.analyze_video(video_path)
+            if prefetched is not None:
+                tracks, extracted = prefetched.result()
+            else:
+                tracks, extracted = self._extract_video_tracks(video_path)
             
             if not tracks:
-                if not self.config.processing.quiet:
+                if not quiet:
                     click.echo("⚠️  No text-based subtitle tracks found")
                 return {'video_path': video_path, 'tracks': [], 'status': 'no_tracks'}
             
-            if not self.config.processing.quiet:
+            if not quiet:
                 click.echo(f"📝 Found {len(tracks)} subtitle track(s)")
             
             # Process each track
             track_results = []
             
-            for i, track_info in enumerate(tracks):
-                if not self.config.processing.quiet:
+            for track_info in tracks:
+                if not quiet:
                     lang_info = f" ({track_info.language})" if track_info.language else ""
                     click.echo(f"⚙️  Processing track {track_info.index} [{track_info.codec}{lang_info}]...")
                 
-                result = self._process_single_track(video_path, track_info)
+                result = self._process_single_track(
+                    video_path, track_info, extracted.get(track_info.index)
+                )
                 track_results.append(result)
             
             return {
@@ -567,7 +763,7 @@ class SubTunerCLI:
             }
             
         except Exception as e:
-            self.logger.error(f"Failed to process {video_path}: {e}")
+            self.logger.error("Failed to process %s: %s", video_path, e)
             return {
                 'video_path': video_path,
                 'tracks': [],
@@ -575,6 +771,46 @@ class SubTunerCLI:
                 'error': str(e)
             }
     
+    def _extract_video_tracks(
+        self,
+        video_path: str
+    ) -> Tuple[list, Dict[int, Union[str, bytes, SubtitleExtractionError]]]:
+        """Analyze a video and extract its subtitle tracks
+        
+        A lone text track is read straight from FFmpeg's output into memory;
+        several tracks are extracted to files in a single FFmpeg pass. Tracks
+        missing from the result are extracted individually by
+        _process_single_track.
+        
+        Args:
+            video_path: Path to video file
+            
+        Returns:
+            Tuple of (subtitle tracks, extracted file path, content or
+            extraction error by track index)
+        """
+        tracks = self.video_analyzer.analyze_video(video_path)
+        if not tracks:
+            return tracks, {}
+        
+        if len(tracks) == 1 and self.extractor.can_pipe(tracks[0]):
+            # The error of a failed pipe is kept for _process_single_track
+            # to report instead of running the same command again
+            track_info = tracks[0]
+            try:
+                content = self.extractor.extract_track_bytes(video_path, track_info)
+            except SubtitleExtractionError as e:
+                content = e
+            return tracks, {track_info.index: content}
+        
+        try:
+            extracted = self.extractor.extract_tracks(video_path, tracks)
+        except SubtitleExtractionError as e:
+            self.logger.warning("Single-pass extraction failed, extracting tracks individually: %s", e)
+            extracted = {}
+        
+        return tracks, extracted
+    
     def process_batch_videos(self, video_paths: List[str]) -> dict:
         """Process multiple video files
         
@@ -584,45 +820,45 @@ class SubTunerCLI:
         Returns:
             Dictionary with batch processing results
         """
-        self.logger.info(f"Processing batch of {len(video_paths)} videos")
+        quiet = self.config.processing.quiet
+        self.logger.info("Processing batch of %d videos", len(video_paths))
         
-        if not self.config.processing.quiet:
+        if not quiet:
             click.echo(f"\n📦 Batch processing {len(video_paths)} videos")
         
         self.reporter.start_session()
         
-        batch_results = {}
+        # (video_path, track results) per input video, filled by position
+        batch_results: List[Tuple[str, List[dict]]] = [None] * len(video_paths)
         successful = 0
         failed = 0
         skipped = 0
         
-        for i, video_path in enumerate(video_paths, 1):
-            if not self.config.processing.quiet:
-                click.echo(f"\n[{i}/{len(video_paths)}] {Path(video_path).name}")
+        jobs = self.config.processing.jobs or min(os.cpu_count() or 1, _MAX_AUTO_JOBS)
+        jobs = min(jobs, len(video_paths))
+        if jobs > 1:
+            outcomes = self._run_batch_parallel(video_paths, jobs)
+        else:
+            outcomes = self._run_batch_serial(video_paths)
+        
+        for index, result in outcomes:
+            # A subtitle file result stands for its single track
+            tracks = result['tracks'] if 'tracks' in result else [result]
+            batch_results[index] = (video_paths[index], tracks)
             
-            try:
-                result = self.process_single_video(video_path)
-                tracks = result.get('tracks', [])
-                batch_results[video_path] = tracks
-                
-                # Check if any tracks were skipped
-                has_skipped = any(t.get('status') == 'skipped' for t in tracks)
-                
-                if result['status'] == 'success':
-                    if has_skipped:
-                        skipped += sum(1 for t in tracks if t.get('status') == 'skipped')
-                    successful += 1
-                else:
-                    failed += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to process {video_path}: {e}")
-                batch_results[video_path] = []
+            # A subtitle file whose output already exists reports 'skipped';
+            # it counts as successful and skipped, like a video whose tracks
+            # were all skipped, rather than as failed
+            if result['status'] in ('success', 'skipped'):
+                # Count tracks that were skipped because the output already exists
+                skipped += sum(1 for t in tracks if t.get('status') == 'skipped')
+                successful += 1
+            else:
                 failed += 1
         
         self.reporter.end_session()
         
-        if not self.config.processing.quiet:
+        if not quiet:
             summary_parts = [f"{successful} successful"]
             if skipped > 0:
                 summary_parts.append(f"{skipped} skipped")
@@ -641,103 +877,215 @@ class SubTunerCLI:
             }
         }
     
-    def _process_single_track(self, video_path: str, track_info) -> dict:
+    def _run_batch_serial(self, video_paths: List[str]) -> Iterator[Tuple[int, dict]]:
+        """Process batch videos one after another in the current process
+        
+        Track analysis and extraction of the next video run in a background
+        thread while the current video's tracks are optimized and written.
+        
+        Args:
+            video_paths: List of video file paths
+            
+        Yields:
+            (position in video_paths, result) tuples in input order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        quiet = self.config.processing.quiet
+        
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            def prefetch(path: str) -> Optional["Future"]:
+                if self._classify(path) != 'video':
+                    return None
+                return prefetcher.submit(self._extract_video_tracks, path)
+            
+            upcoming = prefetch(video_paths[0]) if video_paths else None
+            
+            for index, video_path in enumerate(video_paths):
+                current, upcoming = upcoming, None
+                if index + 1 < len(video_paths):
+                    upcoming = prefetch(video_paths[index + 1])
+                
+                if not quiet:
+                    click.echo(f"\n[{index + 1}/{len(video_paths)}] {os.path.basename(video_path)}")
+                
+                try:
+                    result = self.process_file(video_path, current)
+                except Exception as e:
+                    self.logger.error("Failed to process %s: %s", video_path, e)
+                    result = {'video_path': video_path, 'tracks': [], 'status': 'error', 'error': str(e)}
+                
+                yield index, result
+    
+    def _run_batch_parallel(
+        self,
+        video_paths: List[str],
+        jobs: int
+    ) -> Iterator[Tuple[int, dict]]:
+        """Process batch videos across a pool of worker processes
+        
+        Workers run quietly; a single progress bar advances here as results
+        complete instead of printing a line per video.
+        
+        Args:
+            video_paths: List of video file paths
+            jobs: Number of worker processes
+            
+        Yields:
+            (position in video_paths, result) tuples in completion order
+        """
+        # Imported here: loading multiprocessing is the largest share of
+        # CLI startup and only --jobs runs need it
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        quiet = self.config.processing.quiet
+        worker_config = GlobalConfig(
+            optimization=self.config.optimization,
+            processing=replace(self.config.processing, quiet=True, verbose=False)
+        )
+        
+        progress = nullcontext() if quiet else click.progressbar(
+            length=len(video_paths),
+            label="Processing",
+            item_show_func=lambda name: name
+        )
+        
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_video_worker, initargs=(worker_config,)
+        ) as executor, progress as bar:
+            futures = {
+                executor.submit(_process_video_worker, video_path): index
+                for index, video_path in enumerate(video_paths)
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                video_path = video_paths[index]
+                
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error("Failed to process %s: %s", video_path, e)
+                    result = {'video_path': video_path, 'tracks': [], 'status': 'error', 'error': str(e)}
+                
+                if bar is not None:
+                    bar.update(1, os.path.basename(video_path))
+                
+                yield index, result
+    
+    def _process_single_track(
+        self,
+        video_path: str,
+        track_info,
+        extracted: Optional[Union[str, bytes, SubtitleExtractionError]] = None
+    ) -> dict:
         """Process a single subtitle track
         
         Args:
             video_path: Path to video file
             track_info: Subtitle track information
+            extracted: Already extracted subtitle file path or content, or
+                the error of a failed extraction (extracted here if None)
             
         Returns:
             Dictionary with track processing results
         """
+        processing = self.config.processing
+        quiet = processing.quiet
+        from .parsers.base import get_parser_for_extension, get_parser_for_file
+        from .writers.base import get_writer_for_format
+        
         try:
-            # Extract subtitle track
-            temp_file = self.extractor.extract_track(video_path, track_info)
+            # Extract subtitle track unless it was already extracted; text
+            # tracks are piped into memory, others go through a file
+            if extracted is None:
+                if self.extractor.can_pipe(track_info):
+                    extracted = self.extractor.extract_track_bytes(video_path, track_info)
+                else:
+                    extracted = self.extractor.extract_track(video_path, track_info)
+            elif isinstance(extracted, SubtitleExtractionError):
+                raise extracted
             
-            try:
-                # Parse subtitles
-                parser = get_parser_for_file(temp_file)
-                if not parser:
-                    raise SubTunerError(f"No parser available for track {track_info.index}")
+            # Parse subtitles
+            if isinstance(extracted, bytes):
+                parser = get_parser_for_extension(track_info.format_extension)
+            else:
+                parser = get_parser_for_file(extracted)
+            if not parser:
+                raise SubTunerError(f"No parser available for track {track_info.index}")
+            
+            if isinstance(extracted, bytes):
+                subtitles = parser.parse_bytes(extracted)
+            else:
+                subtitles = parser.parse(extracted)
+            
+            if not subtitles:
+                return {
+                    'track_index': track_info.index,
+                    'status': 'empty',
+                    'original_count': 0,
+                    'optimized_count': 0
+                }
+            
+            # Optimize subtitles
+            optimization_result = self.optimizer.optimize(
+                subtitles,
+                self.config.optimization,
+                track_info.index
+            )
+            
+            # Write optimized subtitles (unless dry run)
+            output_path = None
+            if not processing.dry_run:
+                writer = get_writer_for_format(track_info.codec)
+                if not writer:
+                    raise SubTunerError(f"No writer available for format {track_info.codec}")
                 
-                subtitles = parser.parse(temp_file)
+                # Apply ASS-specific adjustments if this is an ASS track
+                if track_info.codec in ['ass', 'ssa'] and hasattr(writer, 'set_adjustments'):
+                    writer.set_adjustments(
+                        font_size_adjust=processing.ass_font_size_adjust,
+                        y_position_adjust=processing.ass_y_position_adjust
+                    )
                 
-                if not subtitles:
+                output_path = writer.get_output_path(
+                    video_path,
+                    track_info.index,
+                    processing.output_dir,
+                    language=track_info.language,
+                    label=processing.output_label
+                )
+                
+                # Check if file exists and force is not set
+                if os.path.exists(output_path) and not processing.force:
+                    if not quiet:
+                        click.echo(f"⏭️  Skipped: {os.path.basename(output_path)} (already exists, use --force to overwrite)")
                     return {
                         'track_index': track_info.index,
-                        'status': 'empty',
-                        'original_count': 0,
-                        'optimized_count': 0
+                        'track_info': track_info,
+                        'status': 'skipped',
+                        'output_path': output_path,
+                        'original_count': optimization_result.original_count,
+                        'optimized_count': optimization_result.final_count
                     }
                 
-                # Optimize subtitles
-                optimization_result = self.optimizer.optimize(
-                    subtitles, 
-                    self.config.optimization,
-                    track_info.index
-                )
-                
-                # Write optimized subtitles (unless dry run)
-                output_path = None
-                if not self.config.processing.dry_run:
-                    writer = get_writer_for_format(track_info.codec)
-                    if not writer:
-                        raise SubTunerError(f"No writer available for format {track_info.codec}")
-                    
-                    # Apply ASS-specific adjustments if this is an ASS track
-                    if track_info.codec in ['ass', 'ssa'] and hasattr(writer, 'set_adjustments'):
-                        writer.set_adjustments(
-                            font_size_adjust=self.config.processing.ass_font_size_adjust,
-                            y_position_adjust=self.config.processing.ass_y_position_adjust
-                        )
-                    
-                    output_path = writer.get_output_path(
-                        video_path,
-                        track_info.index,
-                        self.config.processing.output_dir,
-                        language=track_info.language,
-                        label=self.config.processing.output_label
-                    )
-                    
-                    # Check if file exists and force is not set
-                    if os.path.exists(output_path) and not self.config.processing.force:
-                        if not self.config.processing.quiet:
-                            click.echo(f"⏭️  Skipped: {Path(output_path).name} (already exists, use --force to overwrite)")
-                        return {
-                            'track_index': track_info.index,
-                            'track_info': track_info,
-                            'status': 'skipped',
-                            'output_path': output_path,
-                            'original_count': len(subtitles),
-                            'optimized_count': len(optimization_result.subtitles)
-                        }
-                    
-                    writer.write_safely(optimization_result.subtitles, output_path)
-                    
-                    if not self.config.processing.quiet:
-                        click.echo(f"💾 Saved: {Path(output_path).name}")
-                
-                return {
-                    'track_index': track_info.index,
-                    'track_info': track_info,
-                    'statistics': optimization_result.statistics,
-                    'output_path': output_path,
-                    'status': 'success',
-                    'original_count': len(subtitles),
-                    'optimized_count': len(optimization_result.subtitles)
-                }
-                
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file):
-                    try:
-                        os.unlink(temp_file)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to clean up temp file {temp_file}: {e}")
+                writer.write_safely(optimization_result.subtitles, output_path)
                 
+                if not quiet:
+                    click.echo(f"💾 Saved: {os.path.basename(output_path)}")
+            
+            return {
+                'track_index': track_info.index,
+                'track_info': track_info,
+                'statistics': optimization_result.statistics,
+                'output_path': output_path,
+                'status': 'success',
+                'original_count': optimization_result.original_count,
+                'optimized_count': optimization_result.final_count
+            }
+            
         except Exception as e:
-            self.logger.error(f"Failed to process track {track_info.index}: {e}")
+            self.logger.error("Failed to process track %s: %s", track_info.index, e)
             return {
                 'track_index': track_info.index,
                 'status': 'error',
@@ -747,7 +1095,7 @@ class SubTunerCLI:
     def generate_reports(
         self, 
         results: dict,
-        report_format: ReportFormat,
+        report_format: "ReportFormat",
         save_path: Optional[str] = None
     ) -> None:
         """Generate and display processing reports
@@ -757,36 +1105,45 @@ class SubTunerCLI:
             report_format: Report format to generate
             save_path: Optional path to save report
         """
+        from .statistics.reporter import ReportFormat
+        
+        quiet = self.config.processing.quiet
+        
         try:
             if results.get('type') == 'batch':
                 # Batch report
-                # Convert results format for reporter
+                # Convert results format for reporter in a single pass
                 batch_stats = {}
-                for video_path, track_results in results['results'].items():
-                    track_stats = []
-                    for track_result in track_results:
-                        if 'statistics' in track_result:
-                            track_stats.append(track_result['statistics'])
+                for video_path, track_results in results['results']:
+                    track_stats = [t['statistics'] for t in track_results if 'statistics' in t]
                     if track_stats:
                         batch_stats[video_path] = track_stats
                 
                 if batch_stats:
-                    report_content = self.reporter.generate_batch_report(
-                        batch_stats, report_format
-                    )
+                    # Stream the report to the console and/or file chunk by chunk
+                    echo_report = not quiet and report_format == ReportFormat.CONSOLE
+                    if echo_report:
+                        click.echo()
                     
-                    if not self.config.processing.quiet and report_format == ReportFormat.CONSOLE:
-                        click.echo("\n" + report_content)
+                    with (self.reporter.open_report(save_path) if save_path else nullcontext()) as report_file:
+                        for chunk in self.reporter.iter_batch_report(batch_stats, report_format):
+                            if echo_report:
+                                click.echo(chunk, nl=False)
+                            if report_file:
+                                report_file.write(chunk)
                     
-                    if save_path:
-                        self.reporter.save_report(report_content, save_path, report_format)
-                        if not self.config.processing.quiet:
-                            click.echo(f"📄 Report saved: {save_path}")
+                    if save_path and not quiet:
+                        click.echo(f"📄 Report saved: {save_path}")
             
             else:
-                # Single video report
-                video_path = results['video_path']
-                track_results = results.get('tracks', [])
+                if 'tracks' in results:
+                    # Single video report
+                    video_path = results['video_path']
+                    track_results = results['tracks']
+                else:
+                    # Single subtitle file report
+                    video_path = results['file_path']
+                    track_results = [results]
                 
                 # Extract statistics
                 track_stats = []
@@ -804,19 +1161,53 @@ class SubTunerCLI:
                             video_path, track_stats, report_format
                         )
                     
-                    if not self.config.processing.quiet and report_format == ReportFormat.CONSOLE:
+                    if not quiet and report_format == ReportFormat.CONSOLE:
                         click.echo("\n" + report_content)
                     
                     if save_path:
                         self.reporter.save_report(report_content, save_path, report_format)
-                        if not self.config.processing.quiet:
+                        if not quiet:
                             click.echo(f"📄 Report saved: {save_path}")
         
         except Exception as e:
-            self.logger.error(f"Failed to generate report: {e}")
-            if not self.config.processing.quiet:
+            self.logger.error("Failed to generate report: %s", e)
+            if not quiet:
                 click.echo(f"⚠️  Failed to generate report: {e}", err=True)
 
 
+# CLI instance owned by a batch worker process, set by _init_video_worker
+_worker_cli: Optional[SubTunerCLI] = None
+
+
+def _init_video_worker(config: GlobalConfig) -> None:
+    """Create and warm up the CLI instance of a batch worker process
+    
+    Args:
+        config: Global configuration for the worker
+    """
+    from multiprocessing.util import Finalize
+    
+    global _worker_cli
+    _worker_cli = SubTunerCLI(config)
+    _worker_cli.warmup()
+    # Pool workers exit without running atexit handlers; a Finalize hook
+    # still removes the worker's temporary directory on shutdown
+    Finalize(_worker_cli, _worker_cli.close, exitpriority=10)
+
+
+def _process_video_worker(video_path: str) -> dict:
+    """Process a single video in a batch worker process
+    
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        video_path: Path to video or subtitle file
+        
+    Returns:
+        Dictionary with processing results
+    """
+    return _worker_cli.process_file(video_path)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,12 +1,29 @@
 """Configuration classes for SubTuner"""
 
+import os
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 from .errors import ConfigurationError
 
+# Config dataclasses use __slots__ where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Allowed (field, minimum, maximum, unit) ranges for OptimizationConfig
+_OPTIMIZATION_RANGES = (
+    ('chars_per_sec', 10.0, 40.0, ''),
+    ('max_duration', 3.0, 15.0, ' seconds'),
+    ('min_duration', 0.5, 2.0, ' seconds'),
+    ('min_gap', 0.01, 0.2, ' seconds'),
+    ('short_threshold', 0.5, 1.5, ' seconds'),
+    ('long_threshold', 2.0, 6.0, ' seconds'),
+    ('max_anticipation', 0.0, 1.0, ' second'),
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OptimizationConfig:
     """Configuration for optimization algorithms"""
     
@@ -38,43 +55,23 @@ class OptimizationConfig:
         """Validate all configuration parameters"""
         errors = []
         
-        # Validate reading speed
-        if not 10.0 <= self.chars_per_sec <= 40.0:
-            errors.append("chars_per_sec must be between 10 and 40")
-        
-        # Validate duration constraints
-        if not 3.0 <= self.max_duration <= 15.0:
-            errors.append("max_duration must be between 3 and 15 seconds")
-        
-        if not 0.5 <= self.min_duration <= 2.0:
-            errors.append("min_duration must be between 0.5 and 2 seconds")
+        # Validate value ranges
+        for name, low, high, unit in _OPTIMIZATION_RANGES:
+            if not low <= getattr(self, name) <= high:
+                errors.append(f"{name} must be between {low:g} and {high:g}{unit}")
         
+        # Validate ordering constraints
         if self.min_duration >= self.max_duration:
             errors.append("min_duration must be less than max_duration")
         
-        # Validate timing constraints
-        if not 0.01 <= self.min_gap <= 0.2:
-            errors.append("min_gap must be between 0.01 and 0.2 seconds")
-        
-        # Validate rebalancing thresholds
-        if not 0.5 <= self.short_threshold <= 1.5:
-            errors.append("short_threshold must be between 0.5 and 1.5 seconds")
-        
-        if not 2.0 <= self.long_threshold <= 6.0:
-            errors.append("long_threshold must be between 2 and 6 seconds")
-        
         if self.short_threshold >= self.long_threshold:
             errors.append("short_threshold must be less than long_threshold")
         
-        # Validate anticipation
-        if not 0.0 <= self.max_anticipation <= 1.0:
-            errors.append("max_anticipation must be between 0 and 1 second")
-        
         if errors:
             raise ConfigurationError("Invalid configuration: " + "; ".join(errors))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration for processing workflow"""
     
@@ -86,6 +83,7 @@ class ProcessingConfig:
     
     # Processing settings
     batch: bool = False
+    jobs: int = 1  # Parallel batch workers (0 = one per CPU, up to 8)
     verbose: bool = False
     quiet: bool = False
     
@@ -102,9 +100,25 @@ class ProcessingConfig:
         """Validate processing configuration"""
         if self.verbose and self.quiet:
             raise ConfigurationError("Cannot be both verbose and quiet")
+        
+        if self.jobs < 0:
+            raise ConfigurationError("jobs must be 0 (auto) or a positive integer")
+        
+        # Path settings are checked once here rather than on every track
+        if os.sep in self.output_label or (os.altsep and os.altsep in self.output_label):
+            raise ConfigurationError("output_label must not contain path separators")
+        
+        if self.temp_dir is not None and not os.path.isdir(self.temp_dir):
+            raise ConfigurationError(f"temp_dir is not a directory: {self.temp_dir}")
+        
+        if self.output_dir is not None:
+            if os.path.exists(self.output_dir) and not os.path.isdir(self.output_dir):
+                raise ConfigurationError(f"output_dir is not a directory: {self.output_dir}")
+            # Resolved once; output paths are joined onto it for every track
+            self.output_dir = os.path.abspath(self.output_dir)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GlobalConfig:
     """Global configuration combining all settings"""
     
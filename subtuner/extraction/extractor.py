@@ -5,14 +5,71 @@ import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Union
 
 from ..errors import FFmpegError, SubtitleExtractionError
 from ..video.analyzer import SubtitleTrackInfo
 
 logger = logging.getLogger(__name__)
 
+# Concurrent FFmpeg processes when tracks are extracted one by one
+_MAX_FALLBACK_WORKERS = 4
+
+# Upper bound on videos extracted concurrently by extract_many
+_MAX_VIDEO_WORKERS = 8
+
+# Codecs that need conversion on extraction (others are stream-copied)
+_CODEC_MAPPING = {
+    'mov_text': 'srt',  # Convert QuickTime text to SRT
+    'text': 'srt',      # Convert generic text to SRT
+}
+
+# FFmpeg muxer for each text format extract_track_bytes can write to a pipe
+# (there is no output file name to infer it from)
+_PIPE_MUXERS = {
+    'srt': 'srt',
+    'ass': 'ass',
+    'vtt': 'webvtt',
+}
+
+
+@lru_cache(maxsize=1)
+def _resolve_default_ffmpeg() -> str:
+    """Locate the ffmpeg binary in PATH or a common install location
+    
+    The result is cached for the process; call
+    _resolve_default_ffmpeg.cache_clear() to look it up again.
+    
+    Returns:
+        Path to the ffmpeg binary
+        
+    Raises:
+        FFmpegError: If ffmpeg cannot be found
+    """
+    # Try to find ffmpeg in PATH
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        return ffmpeg_path
+    
+    # Try common locations
+    common_paths = [
+        "/usr/bin/ffmpeg",
+        "/usr/local/bin/ffmpeg",
+        "C:\\Program Files\\FFmpeg\\bin\\ffmpeg.exe",
+        "C:\\ffmpeg\\bin\\ffmpeg.exe",
+    ]
+    
+    for path in common_paths:
+        if os.path.isfile(path):
+            return path
+    
+    raise FFmpegError(
+        "FFmpeg not found. Please install FFmpeg or specify custom path."
+    )
+
 
 class TempFileManager:
     """Context manager for temporary files"""
@@ -28,32 +85,31 @@ class TempFileManager:
         self.suffix = suffix
         self.prefix = prefix
         self.dir = dir
-        self.temp_file = None
         self.temp_path = None
     
     def __enter__(self) -> str:
         """Create temporary file and return path"""
         try:
-            self.temp_file = tempfile.NamedTemporaryFile(
+            fd, self.temp_path = tempfile.mkstemp(
                 suffix=self.suffix,
                 prefix=self.prefix,
-                dir=self.dir,
-                delete=False
+                dir=self.dir
             )
-            self.temp_path = self.temp_file.name
-            self.temp_file.close()  # Close file handle but keep file
-            logger.debug(f"Created temporary file: {self.temp_path}")
+            os.close(fd)  # Keep the file, only its path is needed
+            logger.debug("Created temporary file: %s", self.temp_path)
             return self.temp_path
         except Exception as e:
             raise SubtitleExtractionError(f"Failed to create temporary file: {e}")
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up temporary file"""
-        if self.temp_path and os.path.exists(self.temp_path):
+        if self.temp_path:
             try:
                 os.unlink(self.temp_path)
-                logger.debug(f"Cleaned up temporary file: {self.temp_path}")
-            except Exception as e:
+                logger.debug("Cleaned up temporary file: %s", self.temp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
                 logger.warning(f"Failed to clean up temporary file {self.temp_path}: {e}")
 
 
@@ -80,26 +136,7 @@ class SubtitleExtractor:
                 return custom_path
             raise FFmpegError(f"Custom ffmpeg path not found: {custom_path}")
         
-        # Try to find ffmpeg in PATH
-        ffmpeg_path = shutil.which("ffmpeg")
-        if ffmpeg_path:
-            return ffmpeg_path
-        
-        # Try common locations
-        common_paths = [
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-            "C:\\Program Files\\FFmpeg\\bin\\ffmpeg.exe",
-            "C:\\ffmpeg\\bin\\ffmpeg.exe",
-        ]
-        
-        for path in common_paths:
-            if os.path.isfile(path):
-                return path
-        
-        raise FFmpegError(
-            "FFmpeg not found. Please install FFmpeg or specify custom path."
-        )
+        return _resolve_default_ffmpeg()
     
     def extract_track(
         self, 
@@ -118,11 +155,118 @@ class SubtitleExtractor:
         Raises:
             SubtitleExtractionError: If extraction fails
         """
-        video_path = Path(video_path)
+        if not os.path.exists(video_path):
+            raise SubtitleExtractionError(f"Video file not found: {video_path}")
         
-        if not video_path.exists():
+        return self._extract_track_unchecked(Path(video_path), track_info)
+    
+    def can_pipe(self, track_info: SubtitleTrackInfo) -> bool:
+        """Check if a track can be extracted to memory by extract_track_bytes
+        
+        Args:
+            track_info: Information about the subtitle track
+            
+        Returns:
+            True for text tracks whose format FFmpeg can write to a pipe
+        """
+        return track_info.is_text_based and track_info.format_extension in _PIPE_MUXERS
+    
+    def extract_track_bytes(
+        self,
+        video_path: str,
+        track_info: SubtitleTrackInfo
+    ) -> bytes:
+        """Extract a text subtitle track into memory through FFmpeg's stdout
+        
+        Nothing is written to disk; pass the result to the parser's
+        parse_bytes(). Tracks that cannot be piped (bitmap formats such as
+        PGS) must go through extract_track() instead.
+        
+        Args:
+            video_path: Path to the video file
+            track_info: Information about the subtitle track
+            
+        Returns:
+            Extracted subtitle content
+            
+        Raises:
+            SubtitleExtractionError: If the track cannot be piped or extraction fails
+        """
+        if not os.path.exists(video_path):
             raise SubtitleExtractionError(f"Video file not found: {video_path}")
         
+        if not self.can_pipe(track_info):
+            raise SubtitleExtractionError(
+                f"Track {track_info.index} ({track_info.codec}) cannot be piped, "
+                f"extract it to a file instead"
+            )
+        
+        logger.info(
+            f"Extracting subtitle track {track_info.index} "
+            f"({track_info.codec}) from {os.path.basename(video_path)} to memory"
+        )
+        
+        cmd = self._build_input_args(video_path)
+        cmd.extend(self._build_output_args(
+            track_info.index,
+            "pipe:1",
+            self._get_output_format(track_info.codec),
+            _PIPE_MUXERS[track_info.format_extension]
+        ))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running extraction command: %s", ' '.join(cmd))
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
+                timeout=300  # 5 minute timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise SubtitleExtractionError(
+                f"FFmpeg timed out while extracting track {track_info.index}"
+            )
+        except subprocess.CalledProcessError as e:
+            error_msg = self._decode_stderr(e.stderr)
+            raise SubtitleExtractionError(
+                f"FFmpeg failed to extract track {track_info.index}: {error_msg}"
+            )
+        except Exception as e:
+            raise SubtitleExtractionError(
+                f"Unexpected error extracting track {track_info.index}: {e}"
+            )
+        
+        if not result.stdout:
+            raise SubtitleExtractionError(
+                f"Extraction produced no output for track {track_info.index}"
+            )
+        
+        logger.info(
+            f"Successfully extracted track {track_info.index} ({len(result.stdout)} bytes)"
+        )
+        
+        return result.stdout
+    
+    def _extract_track_unchecked(
+        self,
+        video_path: Path,
+        track_info: SubtitleTrackInfo
+    ) -> str:
+        """Extract a subtitle track from a video already known to exist
+        
+        Args:
+            video_path: Path to the video file
+            track_info: Information about the subtitle track
+            
+        Returns:
+            Path to the extracted subtitle file
+            
+        Raises:
+            SubtitleExtractionError: If extraction fails
+        """
         logger.info(
             f"Extracting subtitle track {track_info.index} "
             f"({track_info.codec}) from {video_path.name}"
@@ -131,17 +275,16 @@ class SubtitleExtractor:
         # Determine output format
         output_format = self._get_output_format(track_info.codec)
         suffix = f".{track_info.format_extension}"
+        temp_path = None
         # Create temporary file (without auto-cleanup)
         try:
-            temp_file = tempfile.NamedTemporaryFile(
+            fd, temp_path = tempfile.mkstemp(
                 suffix=suffix,
                 prefix="subtuner_",
-                dir=self.temp_dir,
-                delete=False  # Don't auto-delete
+                dir=self.temp_dir
             )
-            temp_path = temp_file.name
-            temp_file.close()  # Close file handle but keep file
-            logger.debug(f"Created temporary file: {temp_path}")
+            os.close(fd)  # Keep the file, FFmpeg writes it by path
+            logger.debug("Created temporary file: %s", temp_path)
             
             # Build FFmpeg command
             cmd = self._build_extraction_command(
@@ -151,29 +294,30 @@ class SubtitleExtractor:
                 output_format
             )
             
-            logger.debug(f"Running extraction command: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running extraction command: %s", ' '.join(cmd))
             
             # Execute FFmpeg
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,  # Output goes to files
+                stderr=subprocess.PIPE,  # Raw bytes, decoded only on failure
                 check=True,
                 timeout=300  # 5 minute timeout
             )
             
             # Verify extraction was successful
-            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
+            size = self._output_size(temp_path)
+            if size == 0:
                 # Clean up failed file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+                self.cleanup_temp_files([temp_path])
                 raise SubtitleExtractionError(
                     f"Extraction produced no output for track {track_info.index}"
                 )
             
             logger.info(
                 f"Successfully extracted track {track_info.index} "
-                f"to {temp_path} ({os.path.getsize(temp_path)} bytes)"
+                f"to {temp_path} ({size} bytes)"
             )
             
             # Return path to extracted file (caller is responsible for cleanup)
@@ -181,27 +325,159 @@ class SubtitleExtractor:
             
         except subprocess.TimeoutExpired:
             # Clean up temp file on error
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                os.unlink(temp_path)
+            if temp_path:
+                self.cleanup_temp_files([temp_path])
             raise SubtitleExtractionError(
                 f"FFmpeg timed out while extracting track {track_info.index}"
             )
         except subprocess.CalledProcessError as e:
             # Clean up temp file on error
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                os.unlink(temp_path)
-            error_msg = e.stderr.strip() if e.stderr else "Unknown error"
+            if temp_path:
+                self.cleanup_temp_files([temp_path])
+            error_msg = self._decode_stderr(e.stderr)
             raise SubtitleExtractionError(
                 f"FFmpeg failed to extract track {track_info.index}: {error_msg}"
             )
         except Exception as e:
             # Clean up temp file on error
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                os.unlink(temp_path)
+            if temp_path:
+                self.cleanup_temp_files([temp_path])
             raise SubtitleExtractionError(
                 f"Unexpected error extracting track {track_info.index}: {e}"
             )
     
+    def extract_tracks(
+        self,
+        video_path: str,
+        tracks: list[SubtitleTrackInfo]
+    ) -> Dict[int, str]:
+        """Extract several subtitle tracks with a single FFmpeg invocation
+        
+        The container is demuxed once and every requested track is written
+        to its own temporary file, instead of spawning one FFmpeg process
+        (and one full read of the video) per track.
+        
+        Args:
+            video_path: Path to the video file
+            tracks: List of subtitle track information
+            
+        Returns:
+            Mapping of track index to extracted temporary file path. Tracks
+            that produced no output are omitted (caller is responsible for
+            cleanup of the returned files)
+            
+        Raises:
+            SubtitleExtractionError: If the FFmpeg invocation fails
+        """
+        if not tracks:
+            return {}
+        
+        video_path = Path(video_path)
+        
+        if not video_path.exists():
+            raise SubtitleExtractionError(f"Video file not found: {video_path}")
+        
+        return self._extract_tracks_unchecked(video_path, tracks)
+    
+    def _extract_tracks_unchecked(
+        self,
+        video_path: Path,
+        tracks: list[SubtitleTrackInfo]
+    ) -> Dict[int, str]:
+        """Extract several subtitle tracks from a video already known to exist
+        
+        Args:
+            video_path: Path to the video file
+            tracks: List of subtitle track information (not empty)
+            
+        Returns:
+            Mapping of track index to extracted temporary file path
+            
+        Raises:
+            SubtitleExtractionError: If the FFmpeg invocation fails
+        """
+        logger.info(f"Extracting {len(tracks)} subtitle tracks from {video_path.name} in one pass")
+        
+        temp_paths = {}
+        try:
+            cmd = self._build_input_args(str(video_path))
+            
+            for track_info in tracks:
+                fd, temp_path = tempfile.mkstemp(
+                    suffix=f".{track_info.format_extension}",
+                    prefix="subtuner_",
+                    dir=self.temp_dir
+                )
+                os.close(fd)  # Keep the file, FFmpeg writes it by path
+                temp_paths[track_info.index] = temp_path
+                
+                cmd.extend(self._build_output_args(
+                    track_info.index,
+                    temp_path,
+                    self._get_output_format(track_info.codec)
+                ))
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running extraction command: %s", ' '.join(cmd))
+            
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,  # Output goes to files
+                stderr=subprocess.PIPE,  # Raw bytes, decoded only on failure
+                check=True,
+                timeout=300  # 5 minute timeout
+            )
+        except subprocess.TimeoutExpired:
+            self.cleanup_temp_files(list(temp_paths.values()))
+            raise SubtitleExtractionError(
+                f"FFmpeg timed out while extracting tracks from {video_path.name}"
+            )
+        except subprocess.CalledProcessError as e:
+            self.cleanup_temp_files(list(temp_paths.values()))
+            error_msg = self._decode_stderr(e.stderr)
+            raise SubtitleExtractionError(
+                f"FFmpeg failed to extract tracks from {video_path.name}: {error_msg}"
+            )
+        except Exception as e:
+            self.cleanup_temp_files(list(temp_paths.values()))
+            raise SubtitleExtractionError(
+                f"Unexpected error extracting tracks from {video_path.name}: {e}"
+            )
+        
+        # Drop tracks that produced no output
+        extracted = {}
+        for index, temp_path in temp_paths.items():
+            if self._output_size(temp_path) > 0:
+                extracted[index] = temp_path
+            else:
+                logger.warning(f"Extraction produced no output for track {index}")
+                self.cleanup_temp_files([temp_path])
+        
+        logger.info(f"Successfully extracted {len(extracted)}/{len(tracks)} tracks")
+        
+        return extracted
+    
+    @staticmethod
+    def _decode_stderr(stderr: Optional[bytes]) -> str:
+        """Decode FFmpeg's captured error output for an error message"""
+        message = stderr.decode("utf-8", errors="replace").strip() if stderr else ""
+        return message or "Unknown error"
+    
+    @staticmethod
+    def _output_size(path: str) -> int:
+        """Get the size of an extracted file with a single stat
+        
+        Args:
+            path: Path to the extracted file
+            
+        Returns:
+            File size in bytes, or 0 if the file does not exist
+        """
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+    
     def _build_extraction_command(
         self, 
         video_path: str, 
@@ -210,23 +486,49 @@ class SubtitleExtractor:
         output_format: Optional[str] = None
     ) -> list[str]:
         """Build FFmpeg command for subtitle extraction"""
-        cmd = [
+        cmd = self._build_input_args(video_path)
+        cmd.extend(self._build_output_args(track_index, output_path, output_format))
+        
+        return cmd
+    
+    def _build_input_args(self, video_path: str) -> list[str]:
+        """Build the FFmpeg arguments preceding the output groups"""
+        return [
             self.ffmpeg_path,
+            "-nostdin",  # Never read the terminal (concurrent runs can hang on it)
+            "-threads", "1",  # Stream copy/remux gains nothing from extra threads
             "-y",  # Overwrite output files
             "-v", "error",  # Only show errors
             "-i", video_path,
+        ]
+    
+    def _build_output_args(
+        self,
+        track_index: int,
+        output_path: str,
+        output_format: Optional[str] = None,
+        muxer: Optional[str] = None
+    ) -> list[str]:
+        """Build the FFmpeg output arguments for one extracted track"""
+        args = [
             "-map", f"0:{track_index}",  # Map specific stream by absolute index
+            "-an", "-vn",  # Subtitle-only output
+            "-map_metadata", "-1", "-map_chapters", "-1",  # Skip container metadata
         ]
         
         # Add codec specification if needed
         if output_format:
-            cmd.extend(["-c:s", output_format])
+            args.extend(["-c:s", output_format])
         else:
-            cmd.extend(["-c:s", "copy"])  # Copy without re-encoding
+            args.extend(["-c:s", "copy"])  # Copy without re-encoding
         
-        cmd.append(output_path)
+        # Explicit container format, needed when writing to a pipe
+        if muxer:
+            args.extend(["-f", muxer])
         
-        return cmd
+        args.append(output_path)
+        
+        return args
     
     def _get_output_format(self, input_codec: str) -> Optional[str]:
         """Get appropriate output format for subtitle codec
@@ -237,13 +539,7 @@ class SubtitleExtractor:
         Returns:
             Output codec name for FFmpeg, or None to copy
         """
-        # Map codecs that need conversion
-        codec_mapping = {
-            'mov_text': 'srt',  # Convert QuickTime text to SRT
-            'text': 'srt',      # Convert generic text to SRT
-        }
-        
-        return codec_mapping.get(input_codec.lower())
+        return _CODEC_MAPPING.get(input_codec.lower())
     
     def extract_all_tracks(
         self, 
@@ -252,6 +548,10 @@ class SubtitleExtractor:
     ) -> list[tuple[SubtitleTrackInfo, str]]:
         """Extract all subtitle tracks from a video
         
+        All tracks are extracted in a single FFmpeg pass; only tracks that
+        pass fails to produce are retried with one FFmpeg process each, run
+        concurrently.
+        
         Args:
             video_path: Path to the video file
             tracks: List of subtitle track information
@@ -266,19 +566,42 @@ class SubtitleExtractor:
             logger.info("No subtitle tracks to extract")
             return []
         
-        logger.info(f"Extracting {len(tracks)} subtitle tracks from {Path(video_path).name}")
+        # Checked once here; the single pass and the per-track fallback
+        # below both skip the check
+        if not os.path.exists(video_path):
+            raise SubtitleExtractionError(f"Video file not found: {video_path}")
+        
+        video_path = Path(video_path)
+        logger.info(f"Extracting {len(tracks)} subtitle tracks from {video_path.name}")
+        
+        try:
+            extracted = self._extract_tracks_unchecked(video_path, tracks)
+        except SubtitleExtractionError as e:
+            logger.warning(f"Single-pass extraction failed, extracting tracks one by one: {e}")
+            extracted = {}
+        
+        # Retry missing tracks concurrently; each FFmpeg run is a separate
+        # process, so the threads only wait on it
+        missing = [track_info for track_info in tracks if track_info.index not in extracted]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(_MAX_FALLBACK_WORKERS, len(missing))) as executor:
+                outcomes = executor.map(
+                    lambda track_info: self._try_extract_track(video_path, track_info), missing
+                )
+                for track_info, outcome in zip(missing, outcomes):
+                    extracted[track_info.index] = outcome
         
         extracted_tracks = []
         failed_tracks = []
         
         for track_info in tracks:
-            try:
-                temp_path = self.extract_track(video_path, track_info)
-                extracted_tracks.append((track_info, temp_path))
-            except SubtitleExtractionError as e:
-                logger.error(f"Failed to extract track {track_info.index}: {e}")
-                failed_tracks.append((track_info.index, str(e)))
+            outcome = extracted[track_info.index]
+            if isinstance(outcome, SubtitleExtractionError):
+                logger.error(f"Failed to extract track {track_info.index}: {outcome}")
+                failed_tracks.append((track_info.index, str(outcome)))
                 # Continue with other tracks rather than failing completely
+            else:
+                extracted_tracks.append((track_info, outcome))
         
         if failed_tracks and not extracted_tracks:
             # All tracks failed
@@ -293,6 +616,98 @@ class SubtitleExtractor:
         
         return extracted_tracks
     
+    def extract_many(
+        self,
+        items: list[tuple[str, list[SubtitleTrackInfo]]],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, list[tuple[SubtitleTrackInfo, str]]]:
+        """Extract the subtitle tracks of several videos concurrently
+        
+        Each video is handled by extract_all_tracks in its own thread; the
+        extractor holds no per-call state, so this is thread-safe. A video
+        whose extraction fails is logged and maps to an empty list, so one
+        bad file does not discard the others' extracted tracks.
+        
+        Args:
+            items: List of (video_path, tracks) pairs
+            max_workers: Maximum number of videos extracted at once
+                (default: one per video, up to _MAX_VIDEO_WORKERS)
+            
+        Returns:
+            Mapping of video path to its (track_info, temp_file_path) tuples
+            (caller is responsible for cleanup of the returned files)
+        """
+        if not items:
+            return {}
+        
+        def extract(item: tuple[str, list[SubtitleTrackInfo]]) -> list[tuple[SubtitleTrackInfo, str]]:
+            video_path, tracks = item
+            try:
+                return self.extract_all_tracks(video_path, tracks)
+            except SubtitleExtractionError as e:
+                logger.error(f"Failed to extract tracks from {video_path}: {e}")
+                return []
+        
+        results = {}
+        if max_workers is None:
+            max_workers = _MAX_VIDEO_WORKERS
+        workers = max(1, min(max_workers, _MAX_VIDEO_WORKERS, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for (video_path, _), extracted in zip(items, executor.map(extract, items)):
+                # A video listed more than once gets all of its tracks
+                results.setdefault(video_path, []).extend(extracted)
+        
+        return results
+    
+    async def extract_all_tracks_in_pool(
+        self,
+        video_path: str,
+        tracks: list[SubtitleTrackInfo],
+        pool: Executor
+    ) -> list[tuple[SubtitleTrackInfo, str]]:
+        """Extract all subtitle tracks in a worker process, awaitably
+        
+        For callers running an asyncio event loop: the FFmpeg spawn and its
+        output handling run in the given pool (normally a
+        ProcessPoolExecutor), so neither the loop nor its default thread
+        pool is blocked. The worker builds its own extractor with this
+        one's ffmpeg path and temp directory.
+        
+        Args:
+            video_path: Path to the video file
+            tracks: List of subtitle track information
+            pool: Executor to run the extraction in
+            
+        Returns:
+            List of tuples (track_info, temp_file_path) for successfully
+            extracted tracks (caller is responsible for cleanup)
+            
+        Raises:
+            SubtitleExtractionError: If extraction fails for all tracks
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            pool,
+            _extract_all_tracks_worker,
+            self.ffmpeg_path,
+            self.temp_dir,
+            video_path,
+            tracks
+        )
+    
+    def _try_extract_track(
+        self,
+        video_path: Path,
+        track_info: SubtitleTrackInfo
+    ) -> Union[str, SubtitleExtractionError]:
+        """Extract a track, returning the error instead of raising it"""
+        try:
+            return self._extract_track_unchecked(video_path, track_info)
+        except SubtitleExtractionError as e:
+            return e
+    
     def cleanup_temp_files(self, temp_paths: list[str]) -> None:
         """Clean up temporary files
         
@@ -300,9 +715,22 @@ class SubtitleExtractor:
             temp_paths: List of temporary file paths to clean up
         """
         for temp_path in temp_paths:
-            if os.path.exists(temp_path):
-                try:
-                    os.unlink(temp_path)
-                    logger.debug(f"Cleaned up temporary file: {temp_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to clean up {temp_path}: {e}")
\ No newline at end of file
+            # Unlink directly; a file that is already gone needs no cleanup
+            try:
+                os.unlink(temp_path)
+                logger.debug("Cleaned up temporary file: %s", temp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to clean up {temp_path}: {e}")
+
+
+def _extract_all_tracks_worker(
+    ffmpeg_path: str,
+    temp_dir: Optional[str],
+    video_path: str,
+    tracks: list[SubtitleTrackInfo]
+) -> list[tuple[SubtitleTrackInfo, str]]:
+    """Run extract_all_tracks in a pool worker (module level so it pickles)"""
+    extractor = SubtitleExtractor(ffmpeg_path=ffmpeg_path, temp_dir=temp_dir)
+    return extractor.extract_all_tracks(video_path, tracks)
@@ -1,6 +1,7 @@
 """Conditional anticipatory offset algorithm"""
 
 import logging
+import math
 from typing import List, Optional, Tuple
 
 from ...config import OptimizationConfig
@@ -37,24 +38,38 @@ class AnticipationAdjuster:
         
         logger.debug(f"Starting anticipatory adjustment for {len(subtitles)} subtitles")
         
-        anticipated = []
+        anticipated = [None] * len(subtitles)
+        
+        # Anticipation only moves start times, so a subtitle's gap to its
+        # predecessor is the same before and after that predecessor is
+        # adjusted. Only the previous end time is carried between steps;
+        # -inf stands for "no previous subtitle".
+        prev_end = -math.inf
+        
+        # Config values are read once here instead of once per subtitle
+        min_duration = config.min_duration
+        max_anticipation = config.max_anticipation
+        min_gap = config.min_gap
+        chars_per_sec = config.chars_per_sec
+        apply_fast = self._apply_fast
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for i, subtitle in enumerate(subtitles):
-            previous = anticipated[-1] if anticipated else None
-            
-            adjusted_subtitle, offset = self.apply_anticipation(
-                subtitle, previous, config
+            adjusted_subtitle, offset = apply_fast(
+                subtitle, prev_end, min_duration, max_anticipation, min_gap, chars_per_sec
             )
             
             if offset > 0:
                 stats.add_anticipation(offset)
-                logger.debug(
-                    f"Subtitle {i}: anticipated by {offset:.3f}s "
-                    f"(start: {subtitle.start_time:.3f}s → {adjusted_subtitle.start_time:.3f}s, "
-                    f"duration: {subtitle.duration:.3f}s → {adjusted_subtitle.duration:.3f}s)"
-                )
+                if debug:
+                    logger.debug(
+                        f"Subtitle {i}: anticipated by {offset:.3f}s "
+                        f"(start: {subtitle.start_time:.3f}s → {adjusted_subtitle.start_time:.3f}s, "
+                        f"duration: {subtitle.duration:.3f}s → {adjusted_subtitle.duration:.3f}s)"
+                    )
             
-            anticipated.append(adjusted_subtitle)
+            anticipated[i] = adjusted_subtitle
+            prev_end = subtitle.end_time
         
         logger.info(
             f"Anticipatory adjustment complete: {stats.anticipated_subtitles} subtitles adjusted, "
@@ -79,28 +94,69 @@ class AnticipationAdjuster:
         Returns:
             Tuple of (adjusted_subtitle, anticipation_amount)
         """
-        # Calculate maximum possible anticipation
-        max_offset = self.calculate_max_anticipation(current, previous, config)
+        prev_end = previous.end_time if previous is not None else -math.inf
+        return self._apply_fast(
+            current, prev_end, config.min_duration, config.max_anticipation,
+            config.min_gap, config.chars_per_sec
+        )
+    
+    def _apply_fast(
+        self,
+        current: Subtitle,
+        prev_end: float,
+        min_duration: float,
+        max_anticipation: float,
+        min_gap: float,
+        chars_per_sec: float
+    ) -> Tuple[Subtitle, float]:
+        """Start subtitle earlier, with the config values passed in as locals
         
-        if max_offset <= 0:
+        Args:
+            current: Current subtitle
+            prev_end: End time of the previous subtitle, -inf if none
+            min_duration: Minimum subtitle duration
+            max_anticipation: Maximum anticipation
+            min_gap: Minimum gap between subtitles
+            chars_per_sec: Reading speed
+            
+        Returns:
+            Tuple of (adjusted_subtitle, anticipation_amount)
+        """
+        # Inlined calculate_max_anticipation, is_beneficial and
+        # validate_anticipation, cheapest checks first so the common
+        # "no anticipation" case returns early and the regex-based
+        # char_count is only computed for real candidates
+        start_time = current.start_time
+        end_time = current.end_time
+        
+        # Maximum possible anticipation, limited to the configured maximum
+        # (with no previous subtitle the room is infinite)
+        max_offset = max(0, start_time - prev_end - min_gap)
+        actual_offset = min(max_offset, max_anticipation)
+        
+        # Too small to be a meaningful benefit (also covers no room at all)
+        if actual_offset < 0.1:
             return current, 0.0
         
-        # Limit to configured maximum
-        actual_offset = min(max_offset, config.max_anticipation)
+        new_start = start_time - actual_offset
+        
+        # The anticipated subtitle must keep valid times, actually get
+        # longer and keep the minimum gap to the previous subtitle
+        if new_start < 0 or new_start >= end_time:
+            return current, 0.0
         
-        # Check if anticipation provides meaningful benefit
-        if not self.is_beneficial(current, actual_offset, config):
+        duration = end_time - start_time
+        if end_time - new_start <= duration:
             return current, 0.0
         
-        # Apply the anticipation
-        new_start = current.start_time - actual_offset
-        new_subtitle = current.with_start_time(new_start)
+        if new_start - prev_end < min_gap:
+            return current, 0.0
         
-        # Validate the adjustment
-        if not self.validate_anticipation(current, new_subtitle, previous, config):
+        # Don't anticipate subtitles that are already long enough
+        if duration >= current.char_count / chars_per_sec and duration >= min_duration:
             return current, 0.0
         
-        return new_subtitle, actual_offset
+        return current.with_start_time(new_start), actual_offset
     
     def calculate_max_anticipation(
         self, 
@@ -284,22 +340,7 @@ class AnticipationAdjuster:
         Returns:
             List of (index, anticipation_amount) tuples, sorted by benefit
         """
-        candidates = []
-        
-        for i, subtitle in enumerate(subtitles):
-            previous = subtitles[i - 1] if i > 0 else None
-            
-            max_anticipation = self.calculate_max_anticipation(subtitle, previous, config)
-            optimal_anticipation = self.calculate_optimal_anticipation(subtitle, previous, config)
-            
-            if optimal_anticipation > 0.1:  # Only consider significant anticipations
-                benefit = self.estimate_benefit(subtitle, optimal_anticipation, config)
-                candidates.append((i, optimal_anticipation, benefit))
-        
-        # Sort by benefit (descending)
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        
-        return [(idx, anticipation) for idx, anticipation, _ in candidates]
+        return self._scan(subtitles, config, collect_candidates=True)[1]
     
     def analyze_anticipation_potential(
         self, 
@@ -315,22 +356,99 @@ class AnticipationAdjuster:
         Returns:
             Analysis results
         """
+        return self._scan(subtitles, config, collect_candidates=False)[0]
+    
+    def scan(
+        self,
+        subtitles: List[Subtitle],
+        config: OptimizationConfig
+    ) -> Tuple[dict, List[Tuple[int, float]]]:
+        """Analyze anticipation potential and collect candidates in one pass
+        
+        Equivalent to calling analyze_anticipation_potential and
+        get_anticipation_candidates, but walks the subtitles only once.
+        
+        Args:
+            subtitles: List of subtitles
+            config: Optimization configuration
+            
+        Returns:
+            Tuple of (analysis results, candidates sorted by benefit)
+        """
+        return self._scan(subtitles, config, collect_candidates=True)
+    
+    def _scan(
+        self,
+        subtitles: List[Subtitle],
+        config: OptimizationConfig,
+        collect_candidates: bool
+    ) -> Tuple[dict, List[Tuple[int, float]]]:
+        """Single traversal behind scan and its two single-purpose callers
+        
+        Args:
+            subtitles: List of subtitles
+            config: Optimization configuration
+            collect_candidates: Whether to compute candidates (needs the
+                character count, the expensive part)
+            
+        Returns:
+            Tuple of (analysis results, candidates sorted by benefit)
+        """
+        # Same arithmetic as calculate_max_anticipation,
+        # calculate_optimal_anticipation and estimate_benefit, fused so the
+        # gap, ideal duration and character count are computed once each
+        min_duration = config.min_duration
+        max_duration = config.max_duration
+        max_anticipation = config.max_anticipation
+        min_gap = config.min_gap
+        chars_per_sec = config.chars_per_sec
+        
         total_subtitles = len(subtitles)
         anticipatable = 0
         total_potential = 0.0
         
+        # Parallel lists; the benefits are only needed as the sort key
+        candidates = []
+        benefits = []
+        previous = None
+        
         for i, subtitle in enumerate(subtitles):
-            previous = subtitles[i - 1] if i > 0 else None
-            potential = self.calculate_max_anticipation(subtitle, previous, config)
+            if previous is None:
+                available = max_anticipation
+            else:
+                available = max(0, subtitle.start_time - previous.end_time - min_gap)
+            previous = subtitle
+            
+            # A candidate's anticipation never exceeds the available room,
+            # so only anticipatable subtitles can be candidates
+            if available <= 0.1:
+                continue
             
-            if potential > 0.1:
-                anticipatable += 1
-                total_potential += potential
+            anticipatable += 1
+            total_potential += available
+            
+            if not collect_candidates:
+                continue
+            
+            duration = subtitle.duration
+            ideal_duration = max(min_duration, min(max_duration, subtitle.char_count / chars_per_sec))
+            needed_duration = max(0, ideal_duration - duration)
+            optimal_anticipation = max(0, min(needed_duration, available, max_anticipation))
+            
+            if optimal_anticipation > 0.1:  # Only consider significant anticipations
+                deficit_after = max(0, ideal_duration - (duration + optimal_anticipation))
+                candidates.append((i, optimal_anticipation))
+                benefits.append(needed_duration - deficit_after)
         
-        return {
+        analysis = {
             'total_subtitles': total_subtitles,
             'anticipatable_count': anticipatable,
             'anticipatable_percentage': (anticipatable / total_subtitles * 100) if total_subtitles > 0 else 0,
             'total_potential': total_potential,
             'avg_potential': total_potential / anticipatable if anticipatable > 0 else 0,
-        }
\ No newline at end of file
+        }
+        
+        # Sort by benefit (descending); ties keep subtitle order
+        order = sorted(range(len(benefits)), key=benefits.__getitem__, reverse=True)
+        
+        return analysis, [candidates[k] for k in order]
@@ -1,6 +1,7 @@
 """Duration adjustment algorithm"""
 
 import logging
+import math
 from typing import List, Optional
 
 from ...config import OptimizationConfig
@@ -43,23 +44,56 @@ class DurationAdjuster:
         logger.debug(f"Starting duration adjustment for {len(subtitles)} subtitles")
         logger.debug(f"Preserving {len(allowed_overlaps)} original overlaps")
         
-        adjusted = []
+        # Same arithmetic as adjust_duration, inlined with the config values
+        # in locals; subtitles whose end time does not move are reused
+        # instead of copied
+        min_duration = config.min_duration
+        max_duration = config.max_duration
+        min_gap = config.min_gap
+        chars_per_sec = config.chars_per_sec
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        count = len(subtitles)
+        adjusted = [None] * count
         
         for i, subtitle in enumerate(subtitles):
-            next_subtitle = subtitles[i + 1] if i + 1 < len(subtitles) else None
-            is_overlap_allowed = (i, i + 1) in allowed_overlaps if next_subtitle else False
-            adjusted_subtitle = self.adjust_duration(subtitle, next_subtitle, config, is_overlap_allowed)
+            start_time = subtitle.start_time
+            end_time = subtitle.end_time
+            duration = end_time - start_time
+            
+            target_duration = max(min_duration, min(max_duration, subtitle.char_count / chars_per_sec))
+            
+            if i + 1 < count:
+                next_subtitle = subtitles[i + 1]
+                if (i, i + 1) in allowed_overlaps:
+                    # Preserve existing overlap: can extend up to original next.end_time
+                    max_possible_duration = next_subtitle.end_time - start_time
+                else:
+                    max_possible_duration = next_subtitle.start_time - min_gap - start_time
+            else:
+                max_possible_duration = math.inf
+            
+            # Only extend, never shorten (semantic preservation)
+            final_duration = max(min(target_duration, max_possible_duration), duration)
+            if final_duration <= 0:
+                final_duration = duration
+            
+            new_end_time = start_time + final_duration
+            if new_end_time == end_time:
+                adjusted[i] = subtitle
+                continue
+            
+            adjusted[i] = subtitle.with_end_time(new_end_time)
             
             # Track changes
-            duration_change = adjusted_subtitle.duration - subtitle.duration
+            duration_change = (new_end_time - start_time) - duration
             if abs(duration_change) > 0.01:  # Only count significant changes
                 stats.add_duration_change(duration_change)
-                logger.debug(
-                    f"Subtitle {i}: duration {subtitle.duration:.3f}s → "
-                    f"{adjusted_subtitle.duration:.3f}s ({duration_change:+.3f}s)"
-                )
-            
-            adjusted.append(adjusted_subtitle)
+                if debug:
+                    logger.debug(
+                        f"Subtitle {i}: duration {duration:.3f}s → "
+                        f"{new_end_time - start_time:.3f}s ({duration_change:+.3f}s)"
+                    )
         
         logger.info(
             f"Duration adjustment complete: {stats.duration_adjustments} adjustments, "
@@ -102,7 +136,7 @@ class DurationAdjuster:
                 # Preserve existing overlap: can extend up to original next.end_time
                 # This allows the overlap to remain as it was
                 max_possible_duration = next_subtitle.end_time - current.start_time
-                logger.debug(f"Allowing overlap with next subtitle (preserving original overlap)")
+                logger.debug("Allowing overlap with next subtitle (preserving original overlap)")
             else:
                 # Normal case: respect min_gap
                 available_end_time = next_subtitle.start_time - config.min_gap
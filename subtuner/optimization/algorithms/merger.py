@@ -1,7 +1,9 @@
 """Subtitle merger algorithm for overlapping and identical subtitles"""
 
 import logging
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Optional
 
 from ...config import OptimizationConfig
 from ...parsers.base import Subtitle
@@ -9,6 +11,31 @@ from ..statistics import OptimizationStatistics
 
 logger = logging.getLogger(__name__)
 
+# Largest gap (seconds) across which identical texts are still merged
+_MAX_MERGE_GAP = 0.5
+
+# Formatting stripped before comparing texts
+_TAG_RE = re.compile(r'<[^>]*>')  # HTML-style tags
+_CURLY_RE = re.compile(r'\{[^}]*\}')  # ASS override blocks
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison (cached: neighbouring pairs share texts)"""
+    # Remove HTML/formatting tags (most texts have none, and a substring
+    # test is much cheaper than a regex pass that finds nothing)
+    clean = text
+    if '<' in clean:
+        clean = _TAG_RE.sub('', clean)
+    if '{' in clean:
+        clean = _CURLY_RE.sub('', clean)
+    
+    # Normalize whitespace
+    clean = ' '.join(clean.split())
+    
+    # Convert to lowercase for comparison
+    return clean.lower().strip()
+
 
 class SubtitleMerger:
     """Algorithm 0: Merge overlapping and identical subtitles (pre-processing)"""
@@ -37,35 +64,56 @@ class SubtitleMerger:
         
         logger.debug(f"Starting subtitle merging for {len(subtitles)} subtitles")
         
+        # Texts are normalized on demand, at most once each, and reused both
+        # as the "next" and the "current" side of the pairwise checks and
+        # for merging
+        count = len(subtitles)
+        normalized = [None] * count
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
         merged = []
         i = 0
         
-        while i < len(subtitles):
+        while i < count:
             current = subtitles[i]
             
-            # Look ahead for mergeable subtitles
-            merge_candidates = [current]
+            # Look ahead for mergeable subtitles; candidates are consecutive,
+            # so the group is subtitles[i:j] and is only materialized when
+            # something merges (most subtitles stand alone)
+            previous = current
             j = i + 1
             
-            while j < len(subtitles):
+            while j < count:
                 next_sub = subtitles[j]
                 
+                # Too far apart for either merge rule, no need to compare texts
+                if next_sub.start_time - previous.end_time > _MAX_MERGE_GAP:
+                    break
+                
+                if normalized[j - 1] is None:
+                    normalized[j - 1] = _normalize_text(previous.text)
+                normalized[j] = _normalize_text(next_sub.text)
+                
                 # Check if we should merge with current group
-                if self._should_merge(merge_candidates[-1], next_sub):
-                    merge_candidates.append(next_sub)
+                if self._should_merge_normalized(
+                    previous, next_sub, normalized[j - 1], normalized[j]
+                ):
+                    previous = next_sub
                     j += 1
                 else:
                     break
             
             # Merge the candidates if we found any
-            if len(merge_candidates) > 1:
-                merged_subtitle = self._merge_subtitles(merge_candidates)
+            if j - i > 1:
+                merge_candidates = subtitles[i:j]
+                merged_subtitle = self._merge_subtitles(merge_candidates, normalized[i:j])
                 merged.append(merged_subtitle)
                 stats.merged_subtitles += len(merge_candidates) - 1
-                logger.debug(
-                    f"Merged {len(merge_candidates)} subtitles at index {i}: "
-                    f"'{merge_candidates[0].text[:30]}...' + {len(merge_candidates)-1} more"
-                )
+                if debug:
+                    logger.debug(
+                        f"Merged {len(merge_candidates)} subtitles at index {i}: "
+                        f"'{merge_candidates[0].text[:30]}...' + {len(merge_candidates)-1} more"
+                    )
             else:
                 merged.append(current)
             
@@ -88,15 +136,40 @@ class SubtitleMerger:
         Returns:
             True if subtitles should be merged
         """
-        # Check for identical text (case-insensitive, whitespace-normalized)
-        current_text = self._normalize_text(current.text)
-        next_text = self._normalize_text(next_sub.text)
+        # Identical texts need a gap of at most _MAX_MERGE_GAP and other
+        # texts an overlap, so distant subtitles are rejected without
+        # comparing texts
+        if next_sub.start_time - current.end_time > _MAX_MERGE_GAP:
+            return False
         
+        return self._should_merge_normalized(
+            current, next_sub, _normalize_text(current.text), _normalize_text(next_sub.text)
+        )
+    
+    def _should_merge_normalized(
+        self,
+        current: Subtitle,
+        next_sub: Subtitle,
+        current_text: str,
+        next_text: str
+    ) -> bool:
+        """Determine if two subtitles should be merged, given their normalized texts
+        
+        Args:
+            current: Current subtitle
+            next_sub: Next subtitle to consider
+            current_text: Normalized text of current
+            next_text: Normalized text of next_sub
+            
+        Returns:
+            True if subtitles should be merged
+        """
+        # Check for identical text (case-insensitive, whitespace-normalized)
         if current_text == next_text and current_text:
             # Identical text - merge if they overlap or are very close
             gap = next_sub.start_time - current.end_time
-            if gap <= 0.5:  # Overlap or very small gap
-                logger.debug(f"Found identical text with gap {gap:.3f}s")
+            if gap <= _MAX_MERGE_GAP:  # Overlap or very small gap
+                logger.debug("Found identical text with gap %.3fs", gap)
                 return True
         
         # Check for overlapping subtitles with similar or complementary text
@@ -111,8 +184,8 @@ class SubtitleMerger:
                 if (current_text in next_text or next_text in current_text or
                     self._is_continuation(current_text, next_text)):
                     logger.debug(
-                        f"Found overlapping subtitles with continuation "
-                        f"(overlap: {overlap_duration:.3f}s)"
+                        "Found overlapping subtitles with continuation (overlap: %.3fs)",
+                        overlap_duration
                     )
                     return True
         
@@ -127,21 +200,15 @@ class SubtitleMerger:
         Returns:
             Normalized text
         """
-        import re
-        
-        # Remove HTML/formatting tags
-        clean = re.sub(r'<[^>]*>', '', text)
-        clean = re.sub(r'\{[^}]*\}', '', clean)
-        
-        # Normalize whitespace
-        clean = ' '.join(clean.split())
-        
-        # Convert to lowercase for comparison
-        return clean.lower().strip()
+        return _normalize_text(text)
     
     def _is_continuation(self, text1: str, text2: str) -> bool:
         """Check if text2 is a continuation of text1
         
+        Both texts must be normalized (see _normalize_text): words are
+        separated by single spaces, which lets the boundary words be
+        located with find/rfind instead of splitting both texts.
+        
         Args:
             text1: First text
             text2: Second text
@@ -156,25 +223,33 @@ class SubtitleMerger:
         # Remove trailing punctuation from text1
         text1_stripped = text1.rstrip('.,!?;: ')
         
-        # Check if text2 starts with the end of text1
-        words1 = text1_stripped.split()
-        words2 = text2.split()
+        # Both texts need at least two words
+        last_space = text1_stripped.rfind(' ')
+        first_space = text2.find(' ')
+        if last_space < 0 or first_space < 0:
+            return False
         
-        if len(words1) >= 2 and len(words2) >= 2:
-            # Check if last 2 words of text1 match first 2 words of text2
-            if words1[-2:] == words2[:2]:
-                return True
-            # Or if last word of text1 matches first word of text2
-            if words1[-1] == words2[0]:
-                return True
+        # Check if last word of text1 matches first word of text2
+        if text1_stripped[last_space + 1:] == text2[:first_space]:
+            return True
         
-        return False
+        # Or if last 2 words of text1 match first 2 words of text2
+        second_space = text2.find(' ', first_space + 1)
+        first_two = text2 if second_space < 0 else text2[:second_space]
+        last_two = text1_stripped[text1_stripped.rfind(' ', 0, last_space) + 1:]
+        
+        return last_two == first_two
     
-    def _merge_subtitles(self, subtitles: List[Subtitle]) -> Subtitle:
+    def _merge_subtitles(
+        self,
+        subtitles: List[Subtitle],
+        normalized: Optional[List[str]] = None
+    ) -> Subtitle:
         """Merge multiple subtitles into one
         
         Args:
             subtitles: List of subtitles to merge
+            normalized: Normalized texts of the subtitles (computed if None)
             
         Returns:
             Merged subtitle
@@ -190,7 +265,7 @@ class SubtitleMerger:
         end_time = max(sub.end_time for sub in subtitles)
         
         # Merge text intelligently
-        merged_text = self._merge_text([sub.text for sub in subtitles])
+        merged_text = self._merge_text([sub.text for sub in subtitles], normalized)
         
         # Use first subtitle's index and metadata as base
         first = subtitles[0]
@@ -203,11 +278,12 @@ class SubtitleMerger:
             metadata=first.metadata.copy()
         )
     
-    def _merge_text(self, texts: List[str]) -> str:
+    def _merge_text(self, texts: List[str], normalized: Optional[List[str]] = None) -> str:
         """Merge multiple text strings intelligently
         
         Args:
             texts: List of text strings to merge
+            normalized: Normalized forms of texts (computed if None)
             
         Returns:
             Merged text
@@ -219,7 +295,8 @@ class SubtitleMerger:
             return texts[0]
         
         # Normalize texts for comparison
-        normalized = [self._normalize_text(t) for t in texts]
+        if normalized is None:
+            normalized = [_normalize_text(t) for t in texts]
         
         # If all texts are identical, return the first one
         if all(n == normalized[0] for n in normalized):
@@ -227,11 +304,13 @@ class SubtitleMerger:
         
         # Check if texts are continuations - if so, use the longest
         # (it likely contains all the information)
-        longest_idx = max(range(len(texts)), key=lambda i: len(normalized[i]))
+        lengths = [len(n) for n in normalized]
+        longest_idx = lengths.index(max(lengths))  # First of the longest
         longest_text = normalized[longest_idx]
         
-        # If the longest text contains all others, use it
-        if all(n in longest_text or longest_text in n for n in normalized):
+        # If the longest text contains all others, use it (no other text is
+        # longer, so the reverse containment would only hold for equal texts)
+        if all(n in longest_text for k, n in enumerate(normalized) if k != longest_idx):
             return texts[longest_idx]
         
         # Otherwise, concatenate unique parts with line breaks
@@ -43,37 +43,81 @@ class TemporalRebalancer:
         logger.debug(f"Starting temporal rebalancing for {len(subtitles)} subtitles")
         logger.debug(f"Preserving {len(allowed_overlaps)} original overlaps")
         
-        rebalanced = subtitles.copy()
-        
-        i = 0
-        while i < len(rebalanced) - 1:
-            current = rebalanced[i]
-            next_subtitle = rebalanced[i + 1]
-            
+        # Same arithmetic as rebalance_pair, should_rebalance and
+        # validate_rebalancing, inlined on parallel lists of start and end
+        # times with the config values in locals. A subtitle can move in two
+        # consecutive pairs (as next, then as current), so Subtitle copies
+        # are only made once, at the end, for subtitles whose times changed
+        starts = [subtitle.start_time for subtitle in subtitles]
+        ends = [subtitle.end_time for subtitle in subtitles]
+        
+        short_threshold = config.short_threshold
+        long_threshold = config.long_threshold
+        min_gap = config.min_gap
+        min_duration = config.min_duration
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Only pairs whose next subtitle is long can rebalance. A pair only
+        # moves its own next subtitle's start, so the next subtitle's
+        # duration is still the original one when its pair is reached and
+        # the pairs can be screened up front; the current subtitle's
+        # duration may have changed and is checked in the loop
+        candidates = [
+            i for i in range(len(subtitles) - 1)
+            if ends[i + 1] - starts[i + 1] > long_threshold
+        ]
+        
+        for i in candidates:
             # Skip rebalancing if this pair has an allowed overlap
-            is_overlap_allowed = (i, i + 1) in allowed_overlaps
+            if (i, i + 1) in allowed_overlaps:
+                if debug:
+                    logger.debug(f"Skipping rebalancing for pair {i}-{i+1} (preserving original overlap)")
+                continue
             
-            if is_overlap_allowed:
-                logger.debug(f"Skipping rebalancing for pair {i}-{i+1} (preserving original overlap)")
-                i += 1
+            current_start = starts[i]
+            current_end = ends[i]
+            current_duration = current_end - current_start
+            if current_duration >= short_threshold:
                 continue
             
-            new_current, new_next, transferred = self.rebalance_pair(
-                current, next_subtitle, config
-            )
+            next_end = ends[i + 1]
+            next_duration = next_end - starts[i + 1]
             
-            if transferred > 0:
-                stats.add_rebalancing_transfer(transferred)
+            # Transfer amount is minimum of deficit and surplus
+            transferred = min(short_threshold - current_duration, next_duration - long_threshold)
+            if transferred <= 0:
+                continue
+            
+            # Apply the transfer while maintaining min_gap
+            new_current_end = current_end + transferred
+            new_next_start = new_current_end + min_gap
+            new_next_duration = next_end - new_next_start
+            
+            if (
+                new_next_start >= next_end
+                or current_start >= new_current_end
+                or new_next_start - new_current_end < min_gap
+                or new_current_end - current_start <= current_duration
+                or new_next_duration < min_duration
+                or new_next_duration < current_duration
+            ):
+                continue
+            
+            stats.add_rebalancing_transfer(transferred)
+            if debug:
                 logger.debug(
                     f"Rebalanced pair {i}-{i+1}: transferred {transferred:.3f}s "
-                    f"(current: {current.duration:.3f}s → {new_current.duration:.3f}s, "
-                    f"next: {next_subtitle.duration:.3f}s → {new_next.duration:.3f}s)"
+                    f"(current: {current_duration:.3f}s → {new_current_end - current_start:.3f}s, "
+                    f"next: {next_duration:.3f}s → {new_next_duration:.3f}s)"
                 )
-                
-                rebalanced[i] = new_current
-                rebalanced[i + 1] = new_next
             
-            i += 1
+            ends[i] = new_current_end
+            starts[i + 1] = new_next_start
+        
+        rebalanced = subtitles.copy()
+        for i, subtitle in enumerate(subtitles):
+            if starts[i] != subtitle.start_time or ends[i] != subtitle.end_time:
+                rebalanced[i] = subtitle.with_times(starts[i], ends[i])
         
         logger.info(
             f"Temporal rebalancing complete: {stats.rebalanced_pairs} pairs rebalanced, "
@@ -289,7 +333,13 @@ class TemporalRebalancer:
         config: OptimizationConfig,
         max_transfer: float
     ) -> float:
-        """Find optimal transfer amount through incremental search
+        """Find the transfer amount with the highest estimated benefit
+        
+        estimate_benefit is piecewise linear in the transfer: it rises at
+        0.5 per second while the transfer is below both the deficit and the
+        surplus, at 1 per second once only the deficit remains, and is flat
+        or falling once the deficit is covered. The best transfer is
+        therefore the whole deficit, capped at max_transfer.
         
         Args:
             current: Current subtitle
@@ -298,22 +348,11 @@ class TemporalRebalancer:
             max_transfer: Maximum allowed transfer
             
         Returns:
-            Optimal transfer amount
+            Optimal transfer amount (0.0 if no transfer is beneficial)
         """
-        best_transfer = 0.0
-        best_benefit = 0.0
+        transfer = min(max(0, config.short_threshold - current.duration), max_transfer)
         
-        # Try different transfer amounts
-        step = 0.1  # 100ms steps
-        transfer = step
-        
-        while transfer <= max_transfer:
-            benefit = self.estimate_benefit(current, next_subtitle, transfer, config)
-            
-            if benefit > best_benefit:
-                best_benefit = benefit
-                best_transfer = transfer
-            
-            transfer += step
+        if self.estimate_benefit(current, next_subtitle, transfer, config) > 0:
+            return transfer
         
-        return best_transfer
\ No newline at end of file
+        return 0.0
@@ -1,5 +1,6 @@
 """Temporal constraints validation algorithm"""
 
+import heapq
 import logging
 from typing import List, Optional
 
@@ -76,37 +77,105 @@ class ConstraintsValidator:
         Returns:
             List of validated subtitles
         """
+        # Same fixes as apply_all_fixes (fix_minimum_duration,
+        # fix_minimum_gap, the chronology and time range checks), swept
+        # over plain floats with the previous kept subtitle's times carried
+        # forward; a Subtitle copy is only made once per changed subtitle.
+        # Fix counts are tallied locally and added to stats at the end
+        min_duration = config.min_duration
+        min_gap = config.min_gap
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        min_duration_fixes = 0
+        gap_fixes = 0
+        chronology_fixes = 0
+        invalid_removed = 0
+        
+        # Flags the subtitles that are the second half of some allowed pair,
+        # so most iterations skip building and hashing the pair tuple
+        n = len(subtitles)
+        has_allowed_overlap = bytearray(n)
+        for _, second in allowed_overlaps:
+            if 0 <= second < n:
+                has_allowed_overlap[second] = 1
+        
         validated = []
+        prev_start = prev_end = None
         
         for i, current in enumerate(subtitles):
-            previous = validated[-1] if validated else None
-            next_subtitle = subtitles[i + 1] if i + 1 < len(subtitles) else None
+            start_time = current.start_time
+            end_time = current.end_time
             
-            # Check if overlap with previous is allowed
-            prev_index = len(validated) - 1
-            is_allowed_overlap = (prev_index, i) in allowed_overlaps if prev_index >= 0 else False
+            # Fix 1: Enforce minimum duration
+            if end_time - start_time < min_duration:
+                end_time = start_time + min_duration
+                min_duration_fixes += 1
+                if debug:
+                    logger.debug(
+                        f"Fixed minimum duration: {current.duration:.3f}s → {end_time - start_time:.3f}s"
+                    )
             
-            # Apply all constraint fixes
-            fixed_subtitle = self.apply_all_fixes(
-                current, previous, next_subtitle, config, stats, is_allowed_overlap
-            )
+            if prev_start is not None:
+                # Fix 2: Enforce minimum gap with previous (skip if overlap is allowed)
+                if has_allowed_overlap[i] and (len(validated) - 1, i) in allowed_overlaps:
+                    logger.debug("Preserving allowed overlap with previous subtitle")
+                else:
+                    current_gap = start_time - prev_end
+                    if current_gap >= min_gap:
+                        pass  # Gap is sufficient
+                    elif current_gap < -0.5:  # Significant overlap = likely intentional
+                        if debug:
+                            logger.debug(f"Preserving overlap (gap: {current_gap:.1f}s)")
+                    else:
+                        # Shift current subtitle forward to maintain minimum gap
+                        duration = end_time - start_time
+                        required_start = prev_end + min_gap
+                        if debug:
+                            logger.debug(
+                                f"Fixed gap: shifted start {start_time:.3f}s → {required_start:.3f}s "
+                                f"(gap: {current_gap:.3f}s → {min_gap:.3f}s)"
+                            )
+                        start_time = required_start
+                        end_time = required_start + duration
+                        gap_fixes += 1
+                
+                # Fix 3: Ensure chronological order (keep original timing if violated)
+                if start_time < prev_start:
+                    chronology_fixes += 1
+                    logger.debug("Chronological order violation, keeping original timing")
+                    start_time = current.start_time
+                    end_time = current.end_time
+            
+            # Fix 4: Ensure valid time range (keep original if invalid)
+            if not (start_time >= 0 and end_time > start_time):
+                logger.debug("Invalid time range, keeping original")
+                start_time = current.start_time
+                end_time = current.end_time
+            
+            fixed_subtitle = current.with_times(start_time, end_time)
             
             # Only remove if basic validation fails
-            if fixed_subtitle and self.is_valid_subtitle(fixed_subtitle, config):
+            if self.is_valid_subtitle(fixed_subtitle, config):
                 # Log warnings for problematic subtitles but keep them
-                if fixed_subtitle.duration < config.min_duration:
-                    logger.debug(f"Kept subtitle at index {i} with short duration: {fixed_subtitle.duration:.3f}s < {config.min_duration:.3f}s")
-                elif fixed_subtitle.duration > 60.0:
-                    logger.debug(f"Kept subtitle at index {i} with long duration: {fixed_subtitle.duration:.3f}s")
+                if debug:
+                    duration = end_time - start_time
+                    if duration < min_duration:
+                        logger.debug(f"Kept subtitle at index {i} with short duration: {duration:.3f}s < {min_duration:.3f}s")
+                    elif duration > 60.0:
+                        logger.debug(f"Kept subtitle at index {i} with long duration: {duration:.3f}s")
                 
                 validated.append(fixed_subtitle)
+                prev_start = start_time
+                prev_end = end_time
             else:
                 # Only remove if basic validation failed
-                stats.invalid_removed += 1
-                if not fixed_subtitle:
-                    logger.warning(f"Removed subtitle at index {i}: Could not be fixed")
-                else:
-                    logger.warning(f"Removed subtitle at index {i}: Basic validation failed - start:{fixed_subtitle.start_time:.3f}s, end:{fixed_subtitle.end_time:.3f}s, text:'{fixed_subtitle.text[:50]}'")
+                invalid_removed += 1
+                logger.warning(f"Removed subtitle at index {i}: Basic validation failed - start:{fixed_subtitle.start_time:.3f}s, end:{fixed_subtitle.end_time:.3f}s, text:'{fixed_subtitle.text[:50]}'")
+        
+        stats.min_duration_fixes += min_duration_fixes
+        stats.gap_fixes += gap_fixes
+        stats.chronology_fixes += chronology_fixes
+        stats.invalid_removed += invalid_removed
         
         return validated
     
@@ -141,17 +210,17 @@ class ConstraintsValidator:
         if not is_allowed_overlap:
             fixed = self.fix_minimum_gap(fixed, previous, config, stats)
         else:
-            logger.debug(f"Preserving allowed overlap with previous subtitle")
+            logger.debug("Preserving allowed overlap with previous subtitle")
         
         # Fix 3: Ensure chronological order (but don't remove, return original if validation fails)
         if not self.is_chronologically_valid(fixed, previous):
             stats.chronology_fixes += 1
-            logger.debug(f"Chronological order violation, keeping original timing")
+            logger.debug("Chronological order violation, keeping original timing")
             return current  # Return original, not fixed version
         
         # Fix 4: Ensure valid time range
         if not self.has_valid_time_range(fixed):
-            logger.debug(f"Invalid time range, keeping original")
+            logger.debug("Invalid time range, keeping original")
             return current  # Return original
         
         return fixed
@@ -180,9 +249,10 @@ class ConstraintsValidator:
         fixed = subtitle.with_end_time(target_end)
         
         stats.min_duration_fixes += 1
-        logger.debug(
-            f"Fixed minimum duration: {subtitle.duration:.3f}s → {fixed.duration:.3f}s"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Fixed minimum duration: {subtitle.duration:.3f}s → {fixed.duration:.3f}s"
+            )
         
         return fixed
     
@@ -215,7 +285,7 @@ class ConstraintsValidator:
         # Only fix small gaps (< 0.5s)
         # Larger gaps/overlaps are likely intentional
         if current_gap < -0.5:  # Significant overlap = likely intentional
-            logger.debug(f"Preserving overlap (gap: {current_gap:.1f}s)")
+            logger.debug("Preserving overlap (gap: %.1fs)", current_gap)
             return current
         
         # Shift current subtitle forward to maintain minimum gap
@@ -225,10 +295,11 @@ class ConstraintsValidator:
         fixed = current.with_times(required_start, required_start + duration)
         
         stats.gap_fixes += 1
-        logger.debug(
-            f"Fixed gap: shifted start {current.start_time:.3f}s → {required_start:.3f}s "
-            f"(gap: {current_gap:.3f}s → {config.min_gap:.3f}s)"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Fixed gap: shifted start {current.start_time:.3f}s → {required_start:.3f}s "
+                f"(gap: {current_gap:.3f}s → {config.min_gap:.3f}s)"
+            )
         
         return fixed
     
@@ -261,11 +332,9 @@ class ConstraintsValidator:
         Returns:
             True if time range is valid
         """
-        return (
-            subtitle.start_time >= 0 and
-            subtitle.end_time > subtitle.start_time and
-            subtitle.duration > 0
-        )
+        # end > start already implies a positive duration: the difference
+        # of two distinct floats is never zero
+        return subtitle.start_time >= 0 and subtitle.end_time > subtitle.start_time
     
     def is_valid_subtitle(
         self,
@@ -292,12 +361,20 @@ class ConstraintsValidator:
     def detect_overlaps(self, subtitles: List[Subtitle]) -> List[tuple[int, int]]:
         """Detect overlapping subtitle pairs
         
+        For chronologically ordered subtitles (the pipeline's case) only
+        adjacent pairs are checked. Unordered input is swept in start time
+        order instead, so every overlapping pair is found, adjacent or not,
+        in O(n log n + k) for k overlaps.
+        
         Args:
             subtitles: List of subtitles to check
             
         Returns:
-            List of (index1, index2) tuples for overlapping pairs
+            List of (index1, index2) tuples for overlapping pairs, index1 < index2
         """
+        if any(a.start_time > b.start_time for a, b in zip(subtitles, subtitles[1:])):
+            return self._sweep_overlaps(subtitles)
+        
         overlaps = []
         
         for i in range(len(subtitles) - 1):
@@ -309,6 +386,38 @@ class ConstraintsValidator:
         
         return overlaps
     
+    def _sweep_overlaps(self, subtitles: List[Subtitle]) -> List[tuple[int, int]]:
+        """Find all overlapping pairs of subtitles in any order
+        
+        Args:
+            subtitles: List of subtitles to check
+            
+        Returns:
+            Sorted list of (index1, index2) tuples, index1 < index2
+        """
+        order = sorted(range(len(subtitles)), key=lambda k: subtitles[k].start_time)
+        
+        # Heap of (end_time, index) for subtitles that started earlier and
+        # may still be running
+        active = []
+        overlaps = []
+        
+        for k in order:
+            start_time = subtitles[k].start_time
+            end_time = subtitles[k].end_time
+            
+            while active and active[0][0] <= start_time:
+                heapq.heappop(active)
+            
+            for _, j in active:
+                if end_time > subtitles[j].start_time:
+                    overlaps.append((j, k) if j < k else (k, j))
+            
+            heapq.heappush(active, (end_time, k))
+        
+        overlaps.sort()
+        return overlaps
+    
     def fix_overlaps(
         self,
         subtitles: List[Subtitle],
@@ -329,23 +438,42 @@ class ConstraintsValidator:
             List of subtitles with overlaps fixed where possible
         """
         fixed = subtitles.copy()
-        overlaps = self.detect_overlaps(fixed)
+        starts = [subtitle.start_time for subtitle in fixed]
+        
+        if all(a <= b for a, b in zip(starts, starts[1:])):
+            # Sorted input (the pipeline's case): only adjacent pairs can be
+            # reported, so find them against the cached start times instead
+            # of a separate detect_overlaps pass. Start times never move
+            # here, so the cache stays valid while end times are trimmed
+            overlaps = [
+                (i, i + 1) for i in range(len(fixed) - 1)
+                if fixed[i].end_time > starts[i + 1]
+            ]
+        else:
+            overlaps = self._sweep_overlaps(fixed)
+        
+        min_gap = config.min_gap
+        min_duration = config.min_duration
+        gap_fixes = 0
         
+        # Subtitles are only ever replaced in place, never removed, so the
+        # overlap indices stay valid for the whole loop
         for i, j in overlaps:
-            if i < len(fixed) and j < len(fixed):
-                current = fixed[i]
-                next_subtitle = fixed[j]
-                
-                # Fix by adjusting current subtitle's end time
-                new_end = next_subtitle.start_time - config.min_gap
-                
-                if new_end > current.start_time + config.min_duration:
-                    fixed[i] = current.with_end_time(new_end)
-                    stats.gap_fixes += 1
-                    logger.debug(f"Fixed overlap between subtitles {i} and {j}")
-                else:
-                    # Can't fix without violating minimum duration, keep original
-                    logger.debug(f"Kept overlapping subtitle {i} (can't fix without making it too short)")
+            current = fixed[i]
+            next_subtitle = fixed[j]
+            
+            # Fix by adjusting current subtitle's end time
+            new_end = next_subtitle.start_time - min_gap
+            
+            if new_end > current.start_time + min_duration:
+                fixed[i] = current.with_end_time(new_end)
+                gap_fixes += 1
+                logger.debug("Fixed overlap between subtitles %d and %d", i, j)
+            else:
+                # Can't fix without violating minimum duration, keep original
+                logger.debug("Kept overlapping subtitle %d (can't fix without making it too short)", i)
+        
+        stats.gap_fixes += gap_fixes
         
         return fixed
     
@@ -363,50 +491,65 @@ class ConstraintsValidator:
         Returns:
             Validation report
         """
-        report = {
-            'total_subtitles': len(subtitles),
-            'valid_subtitles': 0,
-            'violations': {
-                'min_duration': 0,
-                'min_gap': 0,
-                'overlaps': 0,
-                'chronology': 0,
-                'invalid_times': 0,
-            }
-        }
-        
-        for i, subtitle in enumerate(subtitles):
+        # Tallies are kept in locals and the previous subtitle's times are
+        # carried between iterations; the report is built once at the end
+        min_duration = config.min_duration
+        min_gap = config.min_gap
+        
+        valid_subtitles = 0
+        min_duration_violations = 0
+        min_gap_violations = 0
+        overlaps = 0
+        chronology_violations = 0
+        invalid_times = 0
+        
+        prev_start = prev_end = None
+        
+        for subtitle in subtitles:
+            start_time = subtitle.start_time
+            end_time = subtitle.end_time
             is_valid = True
             
             # Check individual subtitle validity
             if not subtitle.validate():
-                report['violations']['invalid_times'] += 1
+                invalid_times += 1
                 is_valid = False
             
             # Check minimum duration
-            if subtitle.duration < config.min_duration:
-                report['violations']['min_duration'] += 1
+            if end_time - start_time < min_duration:
+                min_duration_violations += 1
                 is_valid = False
             
             # Check gaps and chronology
-            if i > 0:
-                prev_subtitle = subtitles[i - 1]
-                
+            if prev_start is not None:
                 # Check chronological order
-                if subtitle.start_time < prev_subtitle.start_time:
-                    report['violations']['chronology'] += 1
+                if start_time < prev_start:
+                    chronology_violations += 1
                     is_valid = False
                 
                 # Check gap
-                gap = subtitle.start_time - prev_subtitle.end_time
-                if gap < config.min_gap:
+                gap = start_time - prev_end
+                if gap < min_gap:
                     if gap < 0:
-                        report['violations']['overlaps'] += 1
+                        overlaps += 1
                     else:
-                        report['violations']['min_gap'] += 1
+                        min_gap_violations += 1
                     is_valid = False
             
             if is_valid:
-                report['valid_subtitles'] += 1
+                valid_subtitles += 1
+            
+            prev_start = start_time
+            prev_end = end_time
         
-        return report
+        return {
+            'total_subtitles': len(subtitles),
+            'valid_subtitles': valid_subtitles,
+            'violations': {
+                'min_duration': min_duration_violations,
+                'min_gap': min_gap_violations,
+                'overlaps': overlaps,
+                'chronology': chronology_violations,
+                'invalid_times': invalid_times,
+            }
+        }
@@ -1,5 +1,6 @@
 """ASS/SSA subtitle parser"""
 
+import io
 import logging
 import os
 import re
@@ -65,27 +66,7 @@ class ASSParser(AbstractParser):
             with open(file_path, 'r', encoding=encoding) as f:
                 doc = ass.parse(f)
             
-            if not doc.events:
-                raise ParsingError("No events found in ASS file")
-            
-            # Convert to internal format
-            subtitles = []
-            for i, event in enumerate(doc.events):
-                try:
-                    subtitle = self._convert_ass_event(event, i, doc)
-                    if subtitle and subtitle.validate():
-                        subtitles.append(subtitle)
-                    else:
-                        logger.warning(f"Skipping invalid event at index {i}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse event at index {i}: {e}")
-                    continue
-            
-            if not subtitles:
-                raise ParsingError("No valid events found in ASS file")
-            
-            logger.info(f"Successfully parsed {len(subtitles)} events from ASS file")
-            return subtitles
+            return self._convert_ass_doc(doc)
             
         except Exception as e:
             if "parsing" in str(e).lower():
@@ -95,6 +76,46 @@ class ASSParser(AbstractParser):
         except Exception as e:
             raise ParsingError(f"Failed to parse ASS file: {e}")
     
+    def parse_bytes(self, data: bytes, encoding: Optional[str] = None) -> List[Subtitle]:
+        """Parse ASS/SSA content held in memory without a temporary file"""
+        logger.info(f"Parsing ASS data ({len(data)} bytes)")
+        
+        content = self.decode_data(data, encoding, "ASS data")
+        
+        try:
+            doc = ass.parse(io.StringIO(content))
+            
+            return self._convert_ass_doc(doc)
+            
+        except ParsingError:
+            raise
+        except Exception as e:
+            raise ParsingError(f"Failed to parse ASS data: {e}")
+    
+    def _convert_ass_doc(self, doc: Any) -> List[Subtitle]:
+        """Convert a parsed ASS document's events to internal Subtitle format"""
+        if not doc.events:
+            raise ParsingError("No events found in ASS file")
+        
+        # Convert to internal format
+        subtitles = []
+        for i, event in enumerate(doc.events):
+            try:
+                subtitle = self._convert_ass_event(event, i, doc)
+                if subtitle and subtitle.validate():
+                    subtitles.append(subtitle)
+                else:
+                    logger.warning(f"Skipping invalid event at index {i}")
+            except Exception as e:
+                logger.warning(f"Failed to parse event at index {i}: {e}")
+                continue
+        
+        if not subtitles:
+            raise ParsingError("No valid events found in ASS file")
+        
+        logger.info(f"Successfully parsed {len(subtitles)} events from ASS file")
+        return subtitles
+    
     def _convert_ass_event(self, event: Any, index: int, doc: Any) -> Optional[Subtitle]:
         """Convert ASS event to internal Subtitle format"""
         try:
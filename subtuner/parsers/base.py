@@ -1,11 +1,40 @@
 """Base classes for subtitle parsers"""
 
+import os
+import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+# Subtitles are created by the thousand during optimization; __slots__
+# (Python 3.10+) halves their size and speeds up attribute access
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Formatting excluded from character counts
+_TAG_RE = re.compile(r'<[^>]*>')  # HTML-style tags
+_ASS_OVERRIDE_RE = re.compile(r'\{[^}]*\}')  # ASS formatting
+
+
+@lru_cache(maxsize=4096)
+def _count_chars(text: str) -> int:
+    """Count the characters of a subtitle text, excluding formatting
+    
+    Cached per text: every algorithm that works from reading speed asks
+    for the same subtitles' counts, and __slots__ leaves no room to store
+    the count on the Subtitle itself.
+    """
+    clean_text = text
+    # Skip the regex passes for the common case of unformatted text
+    if '<' in clean_text:
+        clean_text = _TAG_RE.sub('', clean_text)
+    if '{' in clean_text:
+        clean_text = _ASS_OVERRIDE_RE.sub('', clean_text)
+    return len(clean_text.strip())
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Subtitle:
     """Internal representation of a subtitle entry"""
     
@@ -23,41 +52,25 @@ class Subtitle:
     @property
     def char_count(self) -> int:
         """Get character count (excluding formatting)"""
-        # Remove common HTML/formatting tags for character counting
-        import re
-        clean_text = re.sub(r'<[^>]*>', '', self.text)
-        clean_text = re.sub(r'\{[^}]*\}', '', clean_text)  # ASS formatting
-        return len(clean_text.strip())
+        return _count_chars(self.text)
     
     def with_start_time(self, start_time: float) -> "Subtitle":
-        """Create a copy with new start time"""
-        return Subtitle(
-            index=self.index,
-            start_time=start_time,
-            end_time=self.end_time,
-            text=self.text,
-            metadata=self.metadata.copy()
-        )
+        """Create a copy with new start time (self if the time is unchanged)"""
+        if start_time == self.start_time:
+            return self
+        return Subtitle(self.index, start_time, self.end_time, self.text, self.metadata.copy())
     
     def with_end_time(self, end_time: float) -> "Subtitle":
-        """Create a copy with new end time"""
-        return Subtitle(
-            index=self.index,
-            start_time=self.start_time,
-            end_time=end_time,
-            text=self.text,
-            metadata=self.metadata.copy()
-        )
+        """Create a copy with new end time (self if the time is unchanged)"""
+        if end_time == self.end_time:
+            return self
+        return Subtitle(self.index, self.start_time, end_time, self.text, self.metadata.copy())
     
     def with_times(self, start_time: float, end_time: float) -> "Subtitle":
-        """Create a copy with new start and end times"""
-        return Subtitle(
-            index=self.index,
-            start_time=start_time,
-            end_time=end_time,
-            text=self.text,
-            metadata=self.metadata.copy()
-        )
+        """Create a copy with new start and end times (self if both are unchanged)"""
+        if start_time == self.start_time and end_time == self.end_time:
+            return self
+        return Subtitle(self.index, start_time, end_time, self.text, self.metadata.copy())
     
     def validate(self) -> bool:
         """Validate subtitle entry"""
@@ -101,6 +114,24 @@ class AbstractParser(ABC):
         """
         pass
     
+    def parse_bytes(self, data: bytes, encoding: Optional[str] = None) -> List[Subtitle]:
+        """Parse subtitle content held in memory (e.g. piped from FFmpeg)
+        
+        Parsers that can read from memory override this; the default raises
+        NotImplementedError so callers fall back to a file and parse().
+        
+        Args:
+            data: Subtitle content as bytes
+            encoding: Text encoding (auto-detect if None)
+            
+        Returns:
+            List of parsed subtitles
+            
+        Raises:
+            ParsingError: If parsing fails
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot parse from memory")
+    
     @abstractmethod
     def can_parse(self, file_path: str) -> bool:
         """Check if this parser can handle the given file
@@ -122,13 +153,28 @@ class AbstractParser(ABC):
         Returns:
             Detected encoding name
         """
-        import chardet
-        
         try:
             with open(file_path, 'rb') as f:
                 # Read first 32KB for detection
                 raw_data = f.read(32768)
-                
+        except Exception:
+            # Fallback to UTF-8
+            return 'utf-8'
+        
+        return self._detect_data_encoding(raw_data)
+    
+    def _detect_data_encoding(self, raw_data: bytes) -> str:
+        """Detect the encoding of raw subtitle data
+        
+        Args:
+            raw_data: Leading bytes of the subtitle file
+            
+        Returns:
+            Detected encoding name
+        """
+        import chardet
+        
+        try:
             if not raw_data:
                 return 'utf-8'  # Default for empty files
             
@@ -153,6 +199,9 @@ class AbstractParser(ABC):
     def read_file(self, file_path: str, encoding: Optional[str] = None) -> str:
         """Read subtitle file with proper encoding handling
         
+        The file is read once; encoding detection and decoding fallbacks
+        work on the in-memory bytes.
+        
         Args:
             file_path: Path to subtitle file
             encoding: Text encoding (auto-detect if None)
@@ -165,13 +214,40 @@ class AbstractParser(ABC):
         """
         from ..errors import ParsingError
         
-        if encoding is None:
-            encoding = self.detect_encoding(file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                raw_data = f.read()
+        except Exception as e:
+            raise ParsingError(f"Failed to read file {file_path}: {e}")
+        
+        return self.decode_data(raw_data, encoding, file_path)
+    
+    def decode_data(
+        self,
+        raw_data: bytes,
+        encoding: Optional[str] = None,
+        source: str = "subtitle data"
+    ) -> str:
+        """Decode raw subtitle data with proper encoding handling
+        
+        Args:
+            raw_data: Subtitle content as bytes
+            encoding: Text encoding (auto-detect if None)
+            source: Description of the data for error messages
+            
+        Returns:
+            Decoded content with universal newlines
+            
+        Raises:
+            ParsingError: If the data cannot be decoded
+        """
+        from ..errors import ParsingError
         
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            return content
+            if encoding is None:
+                encoding = self._detect_data_encoding(raw_data[:32768])
+            
+            content = raw_data.decode(encoding)
             
         except UnicodeDecodeError:
             # Try with different encodings
@@ -181,16 +257,18 @@ class AbstractParser(ABC):
                 if fallback == encoding:
                     continue
                 try:
-                    with open(file_path, 'r', encoding=fallback) as f:
-                        content = f.read()
-                    return content
+                    content = raw_data.decode(fallback)
+                    break
                 except UnicodeDecodeError:
                     continue
-            
-            raise ParsingError(f"Could not decode file with any encoding: {file_path}")
+            else:
+                raise ParsingError(f"Could not decode {source} with any encoding")
             
         except Exception as e:
-            raise ParsingError(f"Failed to read file {file_path}: {e}")
+            raise ParsingError(f"Failed to decode {source}: {e}")
+        
+        # Match text-mode reading (universal newlines)
+        return content.replace('\r\n', '\n').replace('\r', '\n')
     
     def _parse_time_seconds(self, time_str: str) -> float:
         """Parse time string and return seconds
@@ -220,6 +298,45 @@ class AbstractParser(ABC):
         raise NotImplementedError("Subclasses must implement time formatting")
 
 
+@lru_cache(maxsize=None)
+def _parsers_for_extension(extension: str) -> Tuple[AbstractParser, ...]:
+    """Get the parsers registered for a file extension (cached per extension)
+    
+    Args:
+        extension: Lower-case file extension (e.g., '.srt')
+        
+    Returns:
+        Parser instances whose supported extensions include the extension
+    """
+    from .srt_parser import SRTParser
+    from .vtt_parser import VTTParser
+    from .ass_parser import ASSParser
+    
+    parsers = (SRTParser(), VTTParser(), ASSParser())
+    
+    return tuple(parser for parser in parsers if extension in parser.supported_extensions)
+
+
+def get_parser_for_extension(extension: str) -> Optional[AbstractParser]:
+    """Get appropriate parser for a file extension
+    
+    Unlike get_parser_for_file, the content is not inspected, so this also
+    works for subtitle data that only exists in memory.
+    
+    Args:
+        extension: File extension (e.g., '.srt', '.vtt', '.ass')
+        
+    Returns:
+        Parser instance, or None if no parser handles the extension
+    """
+    # Normalize extension
+    if not extension.startswith('.'):
+        extension = f'.{extension}'
+    
+    parsers = _parsers_for_extension(extension.lower())
+    return parsers[0] if parsers else None
+
+
 def get_parser_for_file(file_path: str) -> Optional[AbstractParser]:
     """Get appropriate parser for a subtitle file
     
@@ -232,15 +349,12 @@ def get_parser_for_file(file_path: str) -> Optional[AbstractParser]:
     import logging
     logger = logging.getLogger(__name__)
     
-    from .srt_parser import SRTParser
-    from .vtt_parser import VTTParser
-    from .ass_parser import ASSParser
-    
-    parsers = [SRTParser(), VTTParser(), ASSParser()]
-    
     logger.debug(f"Trying to find parser for file: {file_path}")
     
-    for parser in parsers:
+    # Only parsers registered for the extension need to inspect the content
+    extension = os.path.splitext(file_path)[1].lower()
+    
+    for parser in _parsers_for_extension(extension):
         logger.debug(f"Testing {parser.__class__.__name__}")
         if parser.can_parse(file_path):
             logger.debug(f"Selected parser: {parser.__class__.__name__}")
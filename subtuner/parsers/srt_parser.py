@@ -60,32 +60,52 @@ class SRTParser(AbstractParser):
             # Parse with pysrt
             srt_file = pysrt.open(file_path, encoding=encoding)
             
-            if not srt_file:
-                raise ParsingError("No subtitles found in SRT file")
+            return self._convert_srt_file(srt_file)
             
-            # Convert to internal format
-            subtitles = []
-            for i, item in enumerate(srt_file):
-                try:
-                    subtitle = self._convert_srt_item(item, i)
-                    if subtitle and subtitle.validate():
-                        subtitles.append(subtitle)
-                    else:
-                        logger.warning(f"Skipping invalid subtitle at index {i}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse subtitle at index {i}: {e}")
-                    continue
-            
-            if not subtitles:
-                raise ParsingError("No valid subtitles found in SRT file")
+        except pysrt.Error as e:
+            raise ParsingError(f"pysrt parsing error: {e}")
+        except Exception as e:
+            raise ParsingError(f"Failed to parse SRT file: {e}")
+    
+    def parse_bytes(self, data: bytes, encoding: Optional[str] = None) -> List[Subtitle]:
+        """Parse SRT content held in memory without a temporary file"""
+        logger.info(f"Parsing SRT data ({len(data)} bytes)")
+        
+        content = self.decode_data(data, encoding, "SRT data")
+        
+        try:
+            srt_file = pysrt.from_string(content)
             
-            logger.info(f"Successfully parsed {len(subtitles)} subtitles from SRT file")
-            return subtitles
+            return self._convert_srt_file(srt_file)
             
         except pysrt.Error as e:
             raise ParsingError(f"pysrt parsing error: {e}")
         except Exception as e:
-            raise ParsingError(f"Failed to parse SRT file: {e}")
+            raise ParsingError(f"Failed to parse SRT data: {e}")
+    
+    def _convert_srt_file(self, srt_file: pysrt.SubRipFile) -> List[Subtitle]:
+        """Convert a parsed pysrt file to internal Subtitle format"""
+        if not srt_file:
+            raise ParsingError("No subtitles found in SRT file")
+        
+        # Convert to internal format
+        subtitles = []
+        for i, item in enumerate(srt_file):
+            try:
+                subtitle = self._convert_srt_item(item, i)
+                if subtitle and subtitle.validate():
+                    subtitles.append(subtitle)
+                else:
+                    logger.warning(f"Skipping invalid subtitle at index {i}")
+            except Exception as e:
+                logger.warning(f"Failed to parse subtitle at index {i}: {e}")
+                continue
+        
+        if not subtitles:
+            raise ParsingError("No valid subtitles found in SRT file")
+        
+        logger.info(f"Successfully parsed {len(subtitles)} subtitles from SRT file")
+        return subtitles
     
     def _convert_srt_item(self, item: pysrt.SubRipItem, index: int) -> Optional[Subtitle]:
         """Convert pysrt item to internal Subtitle format"""
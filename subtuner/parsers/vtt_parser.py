@@ -1,5 +1,6 @@
 """WebVTT subtitle parser"""
 
+import io
 import logging
 import os
 import re
@@ -56,33 +57,53 @@ class VTTParser(AbstractParser):
             # Parse with webvtt-py library
             vtt_file = webvtt.read(file_path)
             
-            if not vtt_file:
-                raise ParsingError("No captions found in WebVTT file")
-            
-            # Convert to internal format
-            subtitles = []
-            for i, caption in enumerate(vtt_file):
-                try:
-                    subtitle = self._convert_vtt_caption(caption, i)
-                    if subtitle and subtitle.validate():
-                        subtitles.append(subtitle)
-                    else:
-                        logger.warning(f"Skipping invalid caption at index {i}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse caption at index {i}: {e}")
-                    continue
-            
-            if not subtitles:
-                raise ParsingError("No valid captions found in WebVTT file")
-            
-            logger.info(f"Successfully parsed {len(subtitles)} captions from WebVTT file")
-            return subtitles
+            return self._convert_vtt_file(vtt_file)
             
         except webvtt.errors.MalformedFileError as e:
             raise ParsingError(f"Malformed WebVTT file: {e}")
         except Exception as e:
             raise ParsingError(f"Failed to parse WebVTT file: {e}")
     
+    def parse_bytes(self, data: bytes, encoding: Optional[str] = None) -> List[Subtitle]:
+        """Parse WebVTT content held in memory without a temporary file"""
+        logger.info(f"Parsing WebVTT data ({len(data)} bytes)")
+        
+        content = self.decode_data(data, encoding, "WebVTT data")
+        
+        try:
+            vtt_file = webvtt.read_buffer(io.StringIO(content))
+            
+            return self._convert_vtt_file(vtt_file)
+            
+        except webvtt.errors.MalformedFileError as e:
+            raise ParsingError(f"Malformed WebVTT data: {e}")
+        except Exception as e:
+            raise ParsingError(f"Failed to parse WebVTT data: {e}")
+    
+    def _convert_vtt_file(self, vtt_file: webvtt.WebVTT) -> List[Subtitle]:
+        """Convert parsed WebVTT captions to internal Subtitle format"""
+        if not vtt_file:
+            raise ParsingError("No captions found in WebVTT file")
+        
+        # Convert to internal format
+        subtitles = []
+        for i, caption in enumerate(vtt_file):
+            try:
+                subtitle = self._convert_vtt_caption(caption, i)
+                if subtitle and subtitle.validate():
+                    subtitles.append(subtitle)
+                else:
+                    logger.warning(f"Skipping invalid caption at index {i}")
+            except Exception as e:
+                logger.warning(f"Failed to parse caption at index {i}: {e}")
+                continue
+        
+        if not subtitles:
+            raise ParsingError("No valid captions found in WebVTT file")
+        
+        logger.info(f"Successfully parsed {len(subtitles)} captions from WebVTT file")
+        return subtitles
+    
     def _convert_vtt_caption(self, caption: webvtt.Caption, index: int) -> Optional[Subtitle]:
         """Convert WebVTT caption to internal Subtitle format"""
         try:
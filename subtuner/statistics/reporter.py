@@ -2,11 +2,14 @@
 
 import json
 import logging
+import os
+import tempfile
 import time
+from contextlib import contextmanager
 from dataclasses import asdict
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, TextIO, Union
 
 from ..optimization.statistics import OptimizationStatistics
 
@@ -108,16 +111,41 @@ class StatisticsReporter:
         Returns:
             Formatted report string
         """
+        return ''.join(self.iter_batch_report(batch_results, format))
+    
+    def iter_batch_report(
+        self,
+        batch_results: Dict[str, List[OptimizationStatistics]],
+        format: ReportFormat = ReportFormat.CONSOLE
+    ) -> Iterator[str]:
+        """Generate a batch report incrementally
+        
+        Chunks are produced as each video is formatted so large batch
+        reports can be written out without building the whole string.
+        
+        Args:
+            batch_results: Dictionary mapping video paths to track statistics
+            format: Output format
+            
+        Yields:
+            Report text chunks; the last one ends with a newline
+        """
+        if format == ReportFormat.JSON:
+            yield from self._iter_json_batch_report(batch_results)
+            yield "\n"
+            return
+        
         if format == ReportFormat.CONSOLE:
-            return self._generate_console_batch_report(batch_results)
-        elif format == ReportFormat.JSON:
-            return self._generate_json_batch_report(batch_results)
+            lines = self._iter_console_batch_report(batch_results)
         elif format == ReportFormat.MARKDOWN:
-            return self._generate_markdown_batch_report(batch_results)
+            lines = self._iter_markdown_batch_report(batch_results)
         elif format == ReportFormat.CSV:
-            return self._generate_csv_batch_report(batch_results)
+            lines = self._iter_csv_batch_report(batch_results)
         else:
             raise ValueError(f"Unsupported report format: {format}")
+        
+        for line in lines:
+            yield line + "\n"
     
     # Console format implementations
     
@@ -234,16 +262,15 @@ class StatisticsReporter:
         
         return '\n'.join(lines)
     
-    def _generate_console_batch_report(
+    def _iter_console_batch_report(
         self,
         batch_results: Dict[str, List[OptimizationStatistics]]
-    ) -> str:
-        """Generate console report for batch processing"""
-        lines = []
+    ) -> Iterator[str]:
+        """Generate console report lines for batch processing"""
         total_videos = len(batch_results)
         total_tracks = sum(len(tracks) for tracks in batch_results.values())
         
-        lines.extend([
+        yield from [
             "=" * 60,
             "SubTuner Batch Processing Report",
             "=" * 60,
@@ -254,7 +281,7 @@ class StatisticsReporter:
             "",
             "Per-Video Results:",
             "",
-        ])
+        ]
         
         # Per-video summaries
         for video_path, track_stats in batch_results.items():
@@ -263,14 +290,14 @@ class StatisticsReporter:
             total_subtitles = sum(s.original_subtitle_count for s in track_stats)
             total_mods = sum(s.total_modifications for s in track_stats)
             
-            lines.extend([
+            yield from [
                 f"{video_name}:",
                 f"  Tracks: {len(track_stats)}",
                 f"  Subtitles: {total_subtitles:,}",
                 f"  Modifications: {total_mods:,}",
                 f"  Time: {video_processing_time:.2f}s",
                 "",
-            ])
+            ]
         
         # Global aggregates
         all_stats = [stat for tracks in batch_results.values() for stat in tracks]
@@ -279,7 +306,7 @@ class StatisticsReporter:
         global_modifications = sum(s.total_modifications for s in all_stats)
         global_processing_time = sum(s.processing_time for s in all_stats)
         
-        lines.extend([
+        yield from [
             "Global Statistics:",
             f"  Total Original Subtitles: {global_original:,}",
             f"  Total Final Subtitles: {global_final:,}",
@@ -288,9 +315,7 @@ class StatisticsReporter:
             f"  Average Speed: {global_original/global_processing_time:.0f} subtitles/sec" if global_processing_time > 0 else "  Average Speed: N/A",
             "",
             "=" * 60,
-        ])
-        
-        return '\n'.join(lines)
+        ]
     
     # JSON format implementations
     
@@ -325,11 +350,11 @@ class StatisticsReporter:
         }
         return json.dumps(report, indent=2)
     
-    def _generate_json_batch_report(
+    def _iter_json_batch_report(
         self,
         batch_results: Dict[str, List[OptimizationStatistics]]
-    ) -> str:
-        """Generate JSON report for batch processing"""
+    ) -> Iterator[str]:
+        """Generate JSON report chunks for batch processing"""
         videos = []
         for video_path, track_stats in batch_results.items():
             videos.append({
@@ -351,7 +376,7 @@ class StatisticsReporter:
             "global_aggregates": self._calculate_aggregates(all_stats),
             "generated_at": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
         }
-        return json.dumps(report, indent=2)
+        return json.JSONEncoder(indent=2).iterencode(report)
     
     # Markdown format implementations
     
@@ -439,12 +464,12 @@ class StatisticsReporter:
         
         return '\n'.join(lines)
     
-    def _generate_markdown_batch_report(
+    def _iter_markdown_batch_report(
         self,
         batch_results: Dict[str, List[OptimizationStatistics]]
-    ) -> str:
-        """Generate Markdown report for batch processing"""
-        lines = [
+    ) -> Iterator[str]:
+        """Generate Markdown report lines for batch processing"""
+        yield from [
             f"# SubTuner Batch Processing Report",
             f"",
             f"**Videos Processed:** {len(batch_results):,}  ",
@@ -463,7 +488,7 @@ class StatisticsReporter:
             total_subtitles = sum(s.original_subtitle_count for s in track_stats)
             total_mods = sum(s.total_modifications for s in track_stats)
             
-            lines.append(
+            yield (
                 f"| `{video_name}` | {len(track_stats)} | {total_subtitles:,} | "
                 f"{total_mods:,} | {video_processing_time:.2f}s |"
             )
@@ -471,7 +496,7 @@ class StatisticsReporter:
         all_stats = [stat for tracks in batch_results.values() for stat in tracks]
         global_aggregates = self._calculate_aggregates(all_stats)
         
-        lines.extend([
+        yield from [
             f"",
             f"## Global Statistics",
             f"",
@@ -482,9 +507,7 @@ class StatisticsReporter:
             f"| Modifications | {global_aggregates['total_modifications']:,} |",
             f"| Processing Time | {global_aggregates['total_processing_time']:.2f}s |",
             f"| Average Speed | {global_aggregates['total_original']/global_aggregates['total_processing_time']:.0f} subtitles/sec |" if global_aggregates['total_processing_time'] > 0 else f"| Average Speed | N/A |",
-        ])
-        
-        return '\n'.join(lines)
+        ]
     
     # CSV format implementations
     
@@ -533,26 +556,24 @@ class StatisticsReporter:
         
         return '\n'.join(lines)
     
-    def _generate_csv_batch_report(
+    def _iter_csv_batch_report(
         self,
         batch_results: Dict[str, List[OptimizationStatistics]]
-    ) -> str:
-        """Generate CSV report for batch processing"""
-        lines = [
+    ) -> Iterator[str]:
+        """Generate CSV report lines for batch processing"""
+        yield (
             "video_path,track_index,original_subtitles,final_subtitles,duration_adjustments,"
             "rebalanced_pairs,anticipated_subtitles,total_modifications,processing_time"
-        ]
+        )
         
         for video_path, track_stats in batch_results.items():
             for stats in track_stats:
-                lines.append(
+                yield (
                     f"{video_path},{stats.track_index},{stats.original_subtitle_count},"
                     f"{stats.final_subtitle_count},{stats.duration_adjustments},"
                     f"{stats.rebalanced_pairs},{stats.anticipated_subtitles},"
                     f"{stats.total_modifications},{stats.processing_time:.3f}"
                 )
-        
-        return '\n'.join(lines)
     
     # Helper methods
     
@@ -592,19 +613,51 @@ class StatisticsReporter:
             format: Report format (determines file extension if not specified)
         """
         try:
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write report
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with self.open_report(output_path) as f:
                 f.write(report_content)
             
-            logger.info(f"Report saved to {output_path}")
-            
         except Exception as e:
             logger.error(f"Failed to save report to {output_path}: {e}")
             raise
     
+    @contextmanager
+    def open_report(self, output_path: str) -> Iterator[TextIO]:
+        """Open a report file for writing, creating its directory if needed
+        
+        The report is written to a temporary file in the same directory and
+        moved onto output_path when the block exits cleanly, so a report that
+        fails part way leaves any previous file untouched.
+        
+        Args:
+            output_path: Path to save report
+            
+        Yields:
+            Text file handle opened for writing
+        """
+        directory = Path(output_path).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{Path(output_path).name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                yield f
+            
+            # mkstemp creates the file owner-only; give it the usual mode
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        logger.info(f"Report saved to {output_path}")
+    
     def get_default_filename(
         self,
         video_path: str,
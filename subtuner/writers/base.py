@@ -3,8 +3,9 @@
 import logging
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Type
 
 from ..errors import WritingError
 from ..parsers.base import Subtitle
@@ -143,14 +144,11 @@ class AbstractWriter(ABC):
         Returns:
             Output file path
         """
-        video_path = Path(video_path)
-        base_name = video_path.stem
+        video_dir, video_name = os.path.split(video_path)
+        base_name = os.path.splitext(video_name)[0]
         extension = self.supported_extensions[0]  # Use primary extension
         
-        if output_dir:
-            output_directory = Path(output_dir)
-        else:
-            output_directory = video_path.parent
+        output_directory = output_dir or video_dir
         
         # Build filename with optional components
         parts = [base_name, str(track_index)]
@@ -163,7 +161,7 @@ class AbstractWriter(ABC):
         
         output_filename = ".".join(parts) + extension
         
-        return str(output_directory / output_filename)
+        return os.path.join(output_directory, output_filename)
     
     def backup_existing_file(self, file_path: str) -> Optional[str]:
         """Create backup of existing file
@@ -195,28 +193,42 @@ class AbstractWriter(ABC):
             return None
 
 
-def get_writer_for_format(format_name: str) -> Optional[AbstractWriter]:
-    """Get appropriate writer for a subtitle format
+@lru_cache(maxsize=None)
+def _writer_class_for_format(format_name: str) -> Optional[Type[AbstractWriter]]:
+    """Resolve the writer class for a subtitle format (cached per format)
     
     Args:
         format_name: Format name (e.g., 'srt', 'vtt', 'ass')
         
     Returns:
-        Writer instance, or None if no writer can handle the format
+        Writer class, or None if no writer can handle the format
     """
     from .srt_writer import SRTWriter
     from .vtt_writer import VTTWriter
     from .ass_writer import ASSWriter
     
-    writers = [SRTWriter(), VTTWriter(), ASSWriter()]
-    
-    for writer in writers:
-        if writer.can_write(format_name):
-            return writer
+    for writer_class in (SRTWriter, VTTWriter, ASSWriter):
+        if writer_class().can_write(format_name):
+            return writer_class
     
     return None
 
 
+def get_writer_for_format(format_name: str) -> Optional[AbstractWriter]:
+    """Get appropriate writer for a subtitle format
+    
+    Args:
+        format_name: Format name (e.g., 'srt', 'vtt', 'ass')
+        
+    Returns:
+        Writer instance, or None if no writer can handle the format
+    """
+    # Writers hold per-file settings (ASS adjustments), so each call gets
+    # its own instance; only the format lookup is cached
+    writer_class = _writer_class_for_format(format_name)
+    return writer_class() if writer_class else None
+
+
 def get_writer_for_extension(extension: str) -> Optional[AbstractWriter]:
     """Get appropriate writer for a file extension
     
@@ -178,6 +178,48 @@ class TestTemporalRebalancer:
         # New long subtitle shouldn't go below long_threshold
         assert new_long.duration >= default_config.min_duration
     
+    def test_find_optimal_transfer(self, default_config):
+        """Test that the optimal transfer covers the deficit within the limit"""
+        rebalancer = TemporalRebalancer()
+        
+        short_sub = Subtitle(0, 10.0, 10.5, "Short", {})  # 0.5s, 0.3s deficit
+        long_sub = Subtitle(1, 12.0, 16.0, "Long subtitle", {})  # 4.0s
+        
+        assert rebalancer.find_optimal_transfer(
+            short_sub, long_sub, default_config, 1.0
+        ) == pytest.approx(0.3)
+        assert rebalancer.find_optimal_transfer(
+            short_sub, long_sub, default_config, 0.2
+        ) == pytest.approx(0.2)
+        
+        # Nothing to gain for a subtitle that is not short
+        normal = Subtitle(0, 10.0, 12.0, "Normal", {})
+        assert rebalancer.find_optimal_transfer(normal, long_sub, default_config, 1.0) == 0.0
+    
+    def test_process_transfer_off_grid(self, default_config, stats):
+        """Test a deficit that is not a multiple of 0.1s is transferred exactly"""
+        rebalancer = TemporalRebalancer()
+        
+        subtitles = [
+            Subtitle(0, 10.0, 10.55, "Short", {}),  # 0.55s, 0.25s deficit
+            Subtitle(1, 11.0, 15.0, "Long subtitle", {}),  # 4.0s
+            Subtitle(2, 16.0, 18.0, "Normal", {}),
+        ]
+        
+        result = rebalancer.process(subtitles, default_config, stats)
+        
+        assert [(s.start_time, s.end_time) for s in result] == [
+            pytest.approx((10.0, 10.8)),
+            pytest.approx((10.85, 15.0)),
+            (16.0, 18.0),
+        ]
+        assert stats.total_time_transferred == pytest.approx(0.25)
+        
+        # The closed form finds the same 0.25s; a 0.1s step search stops at 0.2s
+        assert rebalancer.find_optimal_transfer(
+            subtitles[0], subtitles[1], default_config, 1.0
+        ) == pytest.approx(0.25)
+    
     def test_process_full_sequence(self, default_config, sample_subtitles, stats):
         """Test processing full subtitle sequence"""
         rebalancer = TemporalRebalancer()
@@ -271,6 +313,15 @@ class TestAnticipationAdjuster:
         # Should maintain chronological order
         for i in range(len(result) - 1):
             assert result[i].start_time <= result[i + 1].start_time
+    
+    def test_scan_matches_separate_passes(self, default_config, sample_subtitles):
+        """Test that scan returns the analysis and candidates of the separate methods"""
+        adjuster = AnticipationAdjuster()
+        
+        analysis, candidates = adjuster.scan(sample_subtitles, default_config)
+        
+        assert analysis == adjuster.analyze_anticipation_potential(sample_subtitles, default_config)
+        assert candidates == adjuster.get_anticipation_candidates(sample_subtitles, default_config)
 
 
 class TestConstraintsValidator:
@@ -375,6 +426,20 @@ class TestConstraintsValidator:
             assert isinstance(idx2, int)
             assert idx2 == idx1 + 1  # Adjacent pairs
     
+    def test_detect_overlaps_unordered(self):
+        """Test that unordered subtitles report every truly overlapping pair"""
+        validator = ConstraintsValidator()
+        
+        subtitles = [
+            Subtitle(0, 20.0, 22.0, "Late", {}),
+            Subtitle(1, 10.0, 15.0, "Long", {}),
+            Subtitle(2, 12.0, 13.0, "Inside long", {}),
+            Subtitle(3, 14.0, 16.0, "Overlaps long", {}),
+        ]
+        
+        # 0-1 are adjacent but do not overlap in time
+        assert validator.detect_overlaps(subtitles) == [(1, 2), (1, 3)]
+    
     def test_validate_sequence(self, default_config, sample_subtitles):
         """Test full sequence validation"""
         validator = ConstraintsValidator()
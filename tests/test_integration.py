@@ -66,37 +66,57 @@ Normal length subtitle
     def test_single_video_processing_success(self, temp_dir, mock_video_file, 
                                            sample_srt_content, mock_subtitle_tracks):
         """Test successful processing of a single video"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False) as srt_file:
-            srt_file.write(sample_srt_content)
-            srt_file.flush()
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        
+        # Mock the video analyzer and extractor; a lone text track is piped
+        with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
+             patch.object(cli.extractor, 'extract_track_bytes',
+                          return_value=sample_srt_content.encode('utf-8')):
+            
+            result = cli.process_single_video(mock_video_file)
+            
+            assert result['status'] == 'success'
+            assert len(result['tracks']) == 1
             
-            try:
-                config = GlobalConfig(
-                    optimization=OptimizationConfig(),
-                    processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
-                )
-                
-                cli = SubTunerCLI(config)
-                
-                # Mock the video analyzer and extractor
-                with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
-                     patch.object(cli.extractor, 'extract_track', return_value=srt_file.name):
-                    
-                    result = cli.process_single_video(mock_video_file)
-                    
-                    assert result['status'] == 'success'
-                    assert len(result['tracks']) == 1
-                    
-                    track_result = result['tracks'][0]
-                    assert track_result['status'] == 'success'
-                    assert track_result['original_count'] > 0
-                    assert track_result['optimized_count'] > 0
-                    assert 'statistics' in track_result
-                    
-            finally:
-                # Clean up
-                if os.path.exists(srt_file.name):
-                    os.unlink(srt_file.name)
+            track_result = result['tracks'][0]
+            assert track_result['status'] == 'success'
+            assert track_result['original_count'] > 0
+            assert track_result['optimized_count'] > 0
+            assert 'statistics' in track_result
+    
+    def test_single_video_pipe_failure_runs_ffmpeg_once(self, mock_video_file, mock_subtitle_tracks):
+        """Test that a failed pipe extraction is reported, not retried"""
+        from subtuner.errors import SubtitleExtractionError
+        
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        
+        # Stand-ins for the FFmpeg-backed components
+        cli.video_analyzer = MagicMock()
+        cli.video_analyzer.analyze_video.return_value = mock_subtitle_tracks
+        cli.extractor = MagicMock()
+        cli.extractor.can_pipe.return_value = True
+        cli.extractor.extract_track_bytes.side_effect = SubtitleExtractionError("Mock error")
+        
+        result = cli.process_single_video(mock_video_file)
+        
+        assert result['status'] == 'success'
+        track_result = result['tracks'][0]
+        assert track_result['status'] == 'error'
+        assert 'Mock error' in track_result['error']
+        
+        cli.extractor.extract_track_bytes.assert_called_once()
+        cli.extractor.extract_track.assert_not_called()
+        cli.extractor.extract_tracks.assert_not_called()
     
     def test_single_video_no_subtitle_tracks(self, mock_video_file):
         """Test processing video with no subtitle tracks"""
@@ -118,74 +138,66 @@ Normal length subtitle
         """Test batch processing of multiple videos"""
         # Create multiple mock video files
         video_files = []
-        srt_files = []
         
         for i in range(3):
             video_path = Path(temp_dir) / f"video_{i}.mkv"
             video_path.write_text(f"fake video content {i}")
             video_files.append(str(video_path))
-            
-            # Create corresponding SRT file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False) as srt_file:
-                srt_file.write(sample_srt_content)
-                srt_files.append(srt_file.name)
         
-        try:
-            config = GlobalConfig(
-                optimization=OptimizationConfig(),
-                processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
-            )
+        # A subtitle file whose output already exists is skipped
+        subtitle_path = Path(temp_dir) / "episode.srt"
+        subtitle_path.write_text(sample_srt_content)
+        (Path(temp_dir) / "episode.fixed.srt").write_text(sample_srt_content)
+        video_files.append(str(subtitle_path))
+        
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        
+        # Mock analyzer and extractor
+        with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
+             patch.object(cli.extractor, 'extract_track_bytes',
+                          return_value=sample_srt_content.encode('utf-8')):
             
-            cli = SubTunerCLI(config)
+            result = cli.process_batch_videos(video_files)
+            
+            assert result['type'] == 'batch'
+            assert result['summary']['total'] == 4
+            assert result['summary']['successful'] >= 0
+            assert len(result['results']) == 4
             
-            # Mock analyzer and extractor
-            with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
-                 patch.object(cli.extractor, 'extract_track', side_effect=srt_files):
-                
-                result = cli.process_batch_videos(video_files)
-                
-                assert result['type'] == 'batch'
-                assert result['summary']['total'] == 3
-                assert result['summary']['successful'] >= 0
-                assert len(result['results']) == 3
-                
-        finally:
-            # Clean up SRT files
-            for srt_file in srt_files:
-                if os.path.exists(srt_file):
-                    os.unlink(srt_file)
+            # The skipped subtitle file counts as successful, not failed
+            assert result['results'][3][1][0]['status'] == 'skipped'
+            assert result['summary']['successful'] == 4
+            assert result['summary']['skipped'] == 1
+            assert result['summary']['failed'] == 0
     
     def test_dry_run_mode(self, temp_dir, mock_video_file, sample_srt_content, mock_subtitle_tracks):
         """Test dry run mode (no files written)"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False) as srt_file:
-            srt_file.write(sample_srt_content)
-            srt_file.flush()
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(output_dir=temp_dir, dry_run=True, quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        
+        with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
+             patch.object(cli.extractor, 'extract_track_bytes',
+                          return_value=sample_srt_content.encode('utf-8')):
             
-            try:
-                config = GlobalConfig(
-                    optimization=OptimizationConfig(),
-                    processing=ProcessingConfig(output_dir=temp_dir, dry_run=True, quiet=True)
-                )
-                
-                cli = SubTunerCLI(config)
-                
-                with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
-                     patch.object(cli.extractor, 'extract_track', return_value=srt_file.name):
-                    
-                    result = cli.process_single_video(mock_video_file)
-                    
-                    assert result['status'] == 'success'
-                    
-                    # In dry run, output_path should be None
-                    track_result = result['tracks'][0]
-                    assert track_result['output_path'] is None
-                    
-                    # Should still have statistics
-                    assert 'statistics' in track_result
-                    
-            finally:
-                if os.path.exists(srt_file.name):
-                    os.unlink(srt_file.name)
+            result = cli.process_single_video(mock_video_file)
+            
+            assert result['status'] == 'success'
+            
+            # In dry run, output_path should be None
+            track_result = result['tracks'][0]
+            assert track_result['output_path'] is None
+            
+            # Should still have statistics
+            assert 'statistics' in track_result
     
     def test_error_handling(self, mock_video_file):
         """Test error handling in CLI"""
@@ -206,6 +218,36 @@ Normal length subtitle
             assert 'error' in result
             assert len(result['tracks']) == 0
     
+    def test_directory_expansion_ignores_extension_case(self, temp_dir):
+        """Test that directory expansion matches and sorts case-insensitively"""
+        for name in ['b.srt', 'a.MKV', 'notes.txt', 'c.Mp4', 'D.ASS', 'e.vtt']:
+            Path(temp_dir, name).write_text("content")
+        os.mkdir(os.path.join(temp_dir, 'extras.mkv'))
+        
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        expanded = cli.expand_video_paths([temp_dir])
+        
+        assert [os.path.basename(p) for p in expanded] == ['a.MKV', 'b.srt', 'c.Mp4', 'D.ASS', 'e.vtt']
+    
+    def test_missing_input_path_is_usage_error(self, temp_dir):
+        """Test that a mistyped path fails as a usage error, even with --quiet"""
+        from click.testing import CliRunner
+        from subtuner.cli import main
+        
+        existing = Path(temp_dir, 'a.srt')
+        existing.write_text("content")
+        missing = os.path.join(temp_dir, 'missing.mkv')
+        
+        result = CliRunner().invoke(main, ['--quiet', str(existing), missing])
+        
+        assert result.exit_code == 2
+        assert 'does not exist' in result.output
+    
     def test_configuration_validation(self):
         """Test that invalid configurations are rejected"""
         with pytest.raises(Exception):  # Should raise ConfigurationError
@@ -217,41 +259,62 @@ Normal length subtitle
     
     def test_report_generation(self, temp_dir, mock_video_file, sample_srt_content, mock_subtitle_tracks):
         """Test report generation and saving"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.srt', delete=False) as srt_file:
-            srt_file.write(sample_srt_content)
-            srt_file.flush()
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
+        )
+        
+        cli = SubTunerCLI(config)
+        
+        with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
+             patch.object(cli.extractor, 'extract_track_bytes',
+                          return_value=sample_srt_content.encode('utf-8')):
+            
+            # Process video
+            result = cli.process_single_video(mock_video_file)
+            
+            # Test report generation
+            from subtuner.statistics.reporter import ReportFormat
+            
+            # Should not raise exception
+            cli.generate_reports(result, ReportFormat.CONSOLE)
             
-            try:
-                config = GlobalConfig(
-                    optimization=OptimizationConfig(),
-                    processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
-                )
-                
-                cli = SubTunerCLI(config)
-                
-                with patch.object(cli.video_analyzer, 'analyze_video', return_value=mock_subtitle_tracks), \
-                     patch.object(cli.extractor, 'extract_track', return_value=srt_file.name):
-                    
-                    # Process video
-                    result = cli.process_single_video(mock_video_file)
-                    
-                    # Test report generation
-                    from subtuner.statistics.reporter import ReportFormat
-                    
-                    # Should not raise exception
-                    cli.generate_reports(result, ReportFormat.CONSOLE)
-                    
-                    # Test saving report
-                    report_path = Path(temp_dir) / "test_report.json"
-                    cli.generate_reports(result, ReportFormat.JSON, str(report_path))
-                    
-                    # Report file should be created
-                    assert report_path.exists()
-                    assert report_path.stat().st_size > 0
-                    
-            finally:
-                if os.path.exists(srt_file.name):
-                    os.unlink(srt_file.name)
+            # Test saving report
+            report_path = Path(temp_dir) / "test_report.json"
+            cli.generate_reports(result, ReportFormat.JSON, str(report_path))
+            
+            # Report file should be created
+            assert report_path.exists()
+            assert report_path.stat().st_size > 0
+    
+    def test_failed_batch_report_keeps_previous_file(self, temp_dir):
+        """Test that a report failing part way does not truncate the saved file"""
+        from subtuner.optimization.statistics import OptimizationStatistics
+        from subtuner.statistics.reporter import ReportFormat
+        
+        config = GlobalConfig(
+            optimization=OptimizationConfig(),
+            processing=ProcessingConfig(output_dir=temp_dir, quiet=True)
+        )
+        cli = SubTunerCLI(config)
+        
+        report_path = Path(temp_dir) / "batch_report.json"
+        report_path.write_text("previous report")
+        
+        def failing_report(batch_stats, report_format):
+            yield "{"
+            raise RuntimeError("report failed")
+        
+        results = {
+            'type': 'batch',
+            'results': [("video.mkv", [{'statistics': OptimizationStatistics()}])]
+        }
+        with patch.object(cli.reporter, 'iter_batch_report', side_effect=failing_report):
+            cli.generate_reports(results, ReportFormat.JSON, str(report_path))
+        
+        # The previous report is intact and no temporary file is left behind
+        assert report_path.read_text() == "previous report"
+        assert os.listdir(temp_dir) == ["batch_report.json"]
 
 
 class TestParserWriterIntegration:
@@ -290,6 +353,23 @@ class TestParserWriterIntegration:
         parsed_again = parser.parse(str(output_path))
         assert len(parsed_again) == len(result.subtitles)
     
+    def test_srt_parse_bytes(self, tmp_path):
+        """Test that in-memory SRT parsing matches parsing the same file"""
+        from subtuner.parsers.srt_parser import SRTParser
+        
+        content = "1\n00:00:01,000 --> 00:00:02,000\nCafé\n\n2\n00:00:03,000 --> 00:00:04,500\nSecond line\n"
+        srt_path = tmp_path / "input.srt"
+        srt_path.write_text(content, encoding='utf-8')
+        
+        parser = SRTParser()
+        subtitles = parser.parse_bytes(content.encode('utf-8'))
+        
+        assert [(s.start_time, s.end_time, s.text) for s in subtitles] == [
+            (1.0, 2.0, "Café"),
+            (3.0, 4.5, "Second line"),
+        ]
+        assert subtitles == parser.parse(str(srt_path))
+    
     def test_format_detection_and_writing(self, temp_dir):
         """Test format detection and appropriate writer selection"""
         from subtuner.parsers.base import get_parser_for_file
@@ -323,6 +403,92 @@ class TestParserWriterIntegration:
         assert ass_writer is not None
 
 
+class TestSubtitleExtraction:
+    """Test subtitle extraction without running FFmpeg"""
+    
+    @pytest.fixture
+    def extractor(self, tmp_path):
+        """Extractor with a placeholder FFmpeg binary"""
+        from subtuner.extraction.extractor import SubtitleExtractor
+        
+        with patch('subtuner.extraction.extractor._resolve_default_ffmpeg', return_value='ffmpeg'):
+            return SubtitleExtractor(temp_dir=str(tmp_path))
+    
+    def test_extract_many_isolates_failures_and_merges_duplicates(self, extractor):
+        """Test that a failing video maps to [] and repeated paths are merged"""
+        from subtuner.errors import SubtitleExtractionError
+        
+        track0 = SubtitleTrackInfo(index=0, codec='subrip')
+        track1 = SubtitleTrackInfo(index=1, codec='ass')
+        
+        def fake_extract_all_tracks(video_path, tracks):
+            if video_path == 'bad.mkv':
+                raise SubtitleExtractionError("Mock error")
+            return [(track, f"{video_path}.{track.index}") for track in tracks]
+        
+        with patch.object(extractor, 'extract_all_tracks', side_effect=fake_extract_all_tracks):
+            results = extractor.extract_many([
+                ('a.mkv', [track0]),
+                ('bad.mkv', [track0]),
+                ('a.mkv', [track1]),
+            ])
+        
+        assert results == {
+            'a.mkv': [(track0, 'a.mkv.0'), (track1, 'a.mkv.1')],
+            'bad.mkv': [],
+        }
+    
+    def test_extract_track_bytes_pipes_ffmpeg_output(self, extractor, tmp_path):
+        """Test that a text track is written to FFmpeg's stdout as SRT"""
+        import subprocess
+        
+        video_path = tmp_path / "video.mkv"
+        video_path.write_text("fake video content")
+        track = SubtitleTrackInfo(index=2, codec='subrip')
+        
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"srt data", stderr=b"")
+        with patch('subprocess.run', return_value=completed) as run:
+            data = extractor.extract_track_bytes(str(video_path), track)
+        
+        assert data == b"srt data"
+        cmd = run.call_args[0][0]
+        assert cmd[-3:] == ['-f', 'srt', 'pipe:1']
+        assert cmd[cmd.index('-map') + 1] == '0:2'
+        assert run.call_args[1]['stdout'] == subprocess.PIPE
+    
+    def test_extract_track_bytes_rejects_bitmap_tracks(self, extractor, tmp_path):
+        """Test that bitmap tracks such as PGS are not piped"""
+        from subtuner.errors import SubtitleExtractionError
+        
+        video_path = tmp_path / "video.mkv"
+        video_path.write_text("fake video content")
+        track = SubtitleTrackInfo(index=3, codec='hdmv_pgs_subtitle')
+        
+        assert not extractor.can_pipe(track)
+        
+        with patch('subprocess.run') as run:
+            with pytest.raises(SubtitleExtractionError):
+                extractor.extract_track_bytes(str(video_path), track)
+        
+        run.assert_not_called()
+    
+    def test_extract_all_tracks_in_pool(self, extractor):
+        """Test that the awaitable extraction forwards to the pool worker"""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        tracks = [SubtitleTrackInfo(index=0, codec='subrip')]
+        extracted = [(tracks[0], '/tmp/track0.srt')]
+        
+        with patch('subtuner.extraction.extractor._extract_all_tracks_worker',
+                   return_value=extracted) as worker, \
+             ThreadPoolExecutor(max_workers=1) as pool:
+            result = asyncio.run(extractor.extract_all_tracks_in_pool('video.mkv', tracks, pool))
+        
+        assert result == extracted
+        worker.assert_called_once_with(extractor.ffmpeg_path, extractor.temp_dir, 'video.mkv', tracks)
+
+
 class TestConfigurationIntegration:
     """Test configuration system integration"""
     
@@ -362,6 +528,14 @@ class TestConfigurationIntegration:
                 min_duration=10.0,  # Too high
                 max_duration=5.0    # Less than min
             )
+    
+    def test_jobs_validation(self):
+        """Test that batch worker count is validated"""
+        assert ProcessingConfig(jobs=0).jobs == 0
+        assert GlobalConfig.from_args(jobs=4).processing.jobs == 4
+        
+        with pytest.raises(Exception):
+            ProcessingConfig(jobs=-1)
 
 
 class TestErrorHandling: